@@ -1,8 +1,5 @@
-from fhir.resources.codeableconcept import CodeableConcept
-from fhir.resources.coding import Coding
 from fhir.resources.quantity import Quantity
 from fhir.resources.reference import Reference
-from ga4gh.vrs.dataproxy import create_dataproxy
 from ga4gh.vrs.models import (
     Allele,
     LiteralSequenceExpression,
@@ -17,16 +14,23 @@ from resources.moleculardefinition import (
     MolecularDefinitionLocation,
     MolecularDefinitionLocationSequenceLocation,
     MolecularDefinitionLocationSequenceLocationCoordinateInterval,
-    MolecularDefinitionLocationSequenceLocationCoordinateIntervalCoordinateSystem,
     MolecularDefinitionRepresentation,
     MolecularDefinitionRepresentationLiteral,
 )
-from conventions.coordinate_systems import vrs_coordinate_interval
+from conventions.coordinate_systems import vrs_coordinate_system
+from conventions.fhir_codes import (
+    ALLELE_STATE_FOCUS,
+    SEQUENCE_TYPE_SYSTEM,
+    focus_concept,
+    molecule_type_concept,
+    refseq_code_concept,
+)
 from conventions.refseq_identifiers import (
     detect_sequence_type,
     validate_accession,
     refseq_to_fhir_id,
 )
+from vrs_tools.dataproxy import CachingDataProxy, get_dataproxy
 from vrs_tools.normalizer import VariantNormalizer
 
 
@@ -37,9 +41,15 @@ class AlleleBuilder:
     """
 
     def __init__(self, dp=None, uri: str | None = None):
-        self.dp = dp or create_dataproxy(uri=uri)
+        self.dp = CachingDataProxy(dp or get_dataproxy(uri=uri))
         self.service = VariantNormalizer(dp=self.dp)
 
+    def _refget(self, context_sequence_id: str) -> str:
+        """Resolve a RefSeq accession to its refget accession (e.g., 'SQ.abc')."""
+        return self.dp.derive_refget_accession(
+            f"refseq:{context_sequence_id}"
+        ).removeprefix("refget:")
+
     def build_vrs_allele(
         self,
         context_sequence_id: str,
@@ -62,12 +72,7 @@ class AlleleBuilder:
             models.Allele: A VRS Allele object, either in normalized form or as originally constructed.
 
         """
-        refget_accession = self.dp.derive_refget_accession(
-            f"refseq:{context_sequence_id}"
-        )
-        seq_ref = SequenceReference(
-            refgetAccession=refget_accession.split("refget:")[-1]
-        )
+        seq_ref = SequenceReference(refgetAccession=self._refget(context_sequence_id))
 
         seq_location = SequenceLocation(
             sequenceReference=seq_ref,
@@ -106,22 +111,9 @@ class AlleleBuilder:
 
         sequence_type = detect_sequence_type(val_sequence_id)
 
-        mol_type = CodeableConcept(
-            coding=[
-                {
-                    "system": "http://hl7.org/fhir/sequence-type",
-                    "code": sequence_type.lower(),
-                    "display": f"{sequence_type} Sequence",
-                }
-            ]
-        )
-
-        coding_ref = Coding(
-            system="http://www.ncbi.nlm.nih.gov/refseq",
-            code=val_sequence_id,
-        )
+        mol_type = molecule_type_concept(SEQUENCE_TYPE_SYSTEM, sequence_type)
 
-        code_value = CodeableConcept(coding=[coding_ref])
+        code_value = refseq_code_concept(val_sequence_id)
         representation_sequence = MolecularDefinitionRepresentation(code=[code_value])
 
         if id_value is not None:
@@ -135,31 +127,17 @@ class AlleleBuilder:
             representation=[representation_sequence],
         )
 
-        system, origin, normalizationMethod = vrs_coordinate_interval()
-
         seq_context = Reference(
             reference=f"#{sequence_profile.id}", type="MolecularDefinition"
         )
-        focus_value = CodeableConcept(
-            coding=[
-                Coding(
-                    system="http://hl7.org/fhir/moleculardefinition-focus",
-                    code="allele-state",
-                    display="Allele State",
-                )
-            ]
-        )
-
         moldef_literal = MolecularDefinitionRepresentationLiteral(
             value=str(allele_state)
         )
         moldef_repr = MolecularDefinitionRepresentation(
-            focus=focus_value, literal=moldef_literal
+            focus=focus_concept(ALLELE_STATE_FOCUS), literal=moldef_literal
         )
 
-        coord_system_fhir = MolecularDefinitionLocationSequenceLocationCoordinateIntervalCoordinateSystem(
-            system=system, origin=origin, normalizationMethod=normalizationMethod
-        )
+        coord_system_fhir = vrs_coordinate_system()
         coord_interval = MolecularDefinitionLocationSequenceLocationCoordinateInterval(
             coordinateSystem=coord_system_fhir,
             startQuantity=Quantity(value=start),
@@ -174,7 +152,7 @@ class AlleleBuilder:
 
         return FhirAllele(
             contained=[sequence_profile],
-            moleculeType=mol_type,
+            moleculeType=molecule_type_concept(SEQUENCE_TYPE_SYSTEM, sequence_type),
             location=[location],
             representation=[moldef_repr],
         )
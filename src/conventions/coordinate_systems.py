@@ -1,9 +1,17 @@
+from functools import lru_cache
+
 from fhir.resources.codeableconcept import CodeableConcept
 from fhir.resources.coding import Coding
 
+from resources.moleculardefinition import (
+    MolecularDefinitionLocationSequenceLocationCoordinateIntervalCoordinateSystem,
+)
+
 
 def _cc(system: str, code: str, display: str) -> CodeableConcept:
-    return CodeableConcept(coding=[Coding(system=system, code=code, display=display)])
+    return CodeableConcept.model_construct(
+        coding=[Coding.model_construct(system=system, code=code, display=display)]
+    )
 
 
 # ------------------------------------------------------------
@@ -52,6 +60,7 @@ RIGHT_SHIFT_NORMALIZATION = _cc(
 # ------------------------------------------------------------
 
 
+@lru_cache(maxsize=None)
 def spdi_coordinate_interval():
     return (
         ZERO_BASE_INTERVAL_SYSTEM,
@@ -60,6 +69,7 @@ def spdi_coordinate_interval():
     )
 
 
+@lru_cache(maxsize=None)
 def vrs_coordinate_interval():
     return (
         ZERO_BASE_INTERVAL_SYSTEM,
@@ -68,6 +78,7 @@ def vrs_coordinate_interval():
     )
 
 
+@lru_cache(maxsize=8)
 def hgvs_coordinate_interval(molType):
     if molType == "DNA":
         return (
@@ -85,3 +96,20 @@ def hgvs_coordinate_interval(molType):
 
     else:
         raise ValueError(f"Unsupported molecular type: {molType}")
+
+
+def coordinate_system(interval):
+    """Build a coordinate system from a (system, origin, normalizationMethod) tuple.
+
+    The concepts are copied so the module constants never end up inside a translated resource.
+    """
+    system, origin, normalization_method = interval
+    return MolecularDefinitionLocationSequenceLocationCoordinateIntervalCoordinateSystem.model_construct(
+        system=system.model_copy(deep=True),
+        origin=origin.model_copy(deep=True),
+        normalizationMethod=normalization_method.model_copy(deep=True),
+    )
+
+
+def vrs_coordinate_system():
+    return coordinate_system(vrs_coordinate_interval())
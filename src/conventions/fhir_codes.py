@@ -0,0 +1,84 @@
+from fhir.resources.codeableconcept import CodeableConcept
+from fhir.resources.coding import Coding
+
+# NOTE: FHIR elements built from known-valid constants or already-validated values are created with model_construct,
+# which skips pydantic validation; the MolecularDefinition elements that enclose them are still validated. Only plain
+# values are shared at module level: the builders return a new instance on every call, so editing one translated
+# resource never changes another.
+
+MOLECULE_TYPE_SYSTEM = "http://hl7.org/fhir/uv/molecular-definition-data-types/CodeSystem/molecule-type"
+FOCUS_SYSTEM = "http://hl7.org/fhir/uv/molecular-definition-data-types/CodeSystem/molecular-definition-focus"
+SEQUENCE_TYPE_SYSTEM = "http://hl7.org/fhir/sequence-type"
+REFSEQ_SYSTEM = "http://www.ncbi.nlm.nih.gov/refseq"
+
+# ------------------------------------------------------------
+# REPRESENTATION FOCUS
+# ------------------------------------------------------------
+# (system, code, display) of each representation focus.
+ALLELE_STATE_FOCUS = (
+    "http://hl7.org/fhir/moleculardefinition-focus",
+    "allele-state",
+    "Allele State",
+)
+REFERENCE_STATE_FOCUS = (FOCUS_SYSTEM, "reference-state", "Reference State")
+ALTERNATIVE_STATE_FOCUS = (FOCUS_SYSTEM, "alternative-state", "Alternative State")
+
+
+def focus_concept(focus: tuple[str, str, str]) -> CodeableConcept:
+    """Build a representation focus CodeableConcept.
+
+    Args:
+        focus (tuple[str, str, str]): One of the focus constants (e.g., `ALLELE_STATE_FOCUS`).
+
+    Returns:
+        CodeableConcept: A single-coding concept for the focus.
+    """
+    system, code, display = focus
+    return CodeableConcept.model_construct(
+        coding=[Coding.model_construct(system=system, code=code, display=display)]
+    )
+
+
+# ------------------------------------------------------------
+# MOLECULE TYPES
+# ------------------------------------------------------------
+
+
+def molecule_type_concept(system: str, molecule_type: str) -> CodeableConcept:
+    """Build the moleculeType CodeableConcept for a molecule or sequence type under a code system.
+
+    Args:
+        system (str): The code system of the coding (e.g., `SEQUENCE_TYPE_SYSTEM` or `MOLECULE_TYPE_SYSTEM`).
+        molecule_type (str): The molecule or sequence type (e.g., 'DNA', 'RNA', 'protein').
+
+    Returns:
+        CodeableConcept: A single-coding concept (e.g., code 'dna', display 'DNA Sequence').
+    """
+    return CodeableConcept.model_construct(
+        coding=[
+            Coding.model_construct(
+                system=system,
+                code=molecule_type.lower(),
+                display=f"{molecule_type} Sequence",
+            )
+        ]
+    )
+
+
+# ------------------------------------------------------------
+# SEQUENCE IDENTIFIERS
+# ------------------------------------------------------------
+
+
+def refseq_code_concept(refseq_id: str) -> CodeableConcept:
+    """Build the representation code CodeableConcept identifying a RefSeq sequence.
+
+    Args:
+        refseq_id (str): A RefSeq accession that has already been validated or translated (e.g., 'NM_000769.4').
+
+    Returns:
+        CodeableConcept: A concept holding a single RefSeq coding for the accession.
+    """
+    return CodeableConcept.model_construct(
+        coding=[Coding.model_construct(system=REFSEQ_SYSTEM, code=refseq_id)]
+    )
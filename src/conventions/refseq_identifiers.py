@@ -1,11 +1,29 @@
 import re
+import string
+from functools import lru_cache
 
 from exceptions.utils import (
     InvalidAccessionError,
     InvalidSequenceTypeError,
 )
 
+_REFSEQ_RE = re.compile(r"(NC_|NG_|NM_|NR_|NP_)\d+\.\d+")
 
+_PREFIX_TO_TYPE = {
+    "NC_": "DNA",
+    "NG_": "DNA",
+    "NW_": "DNA",
+    "NT_": "DNA",
+    "NM_": "RNA",
+    "NR_": "RNA",
+    "NP_": "protein",
+}
+
+# Lowercases ASCII letters and drops underscores in a single pass.
+_FHIR_ID_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase, "_")
+
+
+@lru_cache(maxsize=4096)
 def refseq_to_fhir_id(refseq_accession):
     """Convert a RefSeq accession to a FHIR-compatible ID.
 
@@ -15,9 +33,10 @@ def refseq_to_fhir_id(refseq_accession):
     Returns:
         str: A normalized FHIR-compatible ID (e.g., 'nm001200').
     """
-    return refseq_accession.split(".", 1)[0].replace("_", "").lower()
+    return refseq_accession.partition(".")[0].translate(_FHIR_ID_TABLE)
 
 
+@lru_cache(maxsize=4096)
 def detect_sequence_type(sequence_id: str) -> str:
     """Translate the prefix of the RefSeq identifier to the type of sequence.
 
@@ -31,23 +50,16 @@ def detect_sequence_type(sequence_id: str) -> str:
         str: The type of sequence
 
     """
-    prefix_to_type = {
-        "NC_": "DNA",
-        "NG_": "DNA",
-        "NW_": "DNA",
-        "NT_": "DNA",
-        "NM_": "RNA",
-        "NR_": "RNA",
-        "NP_": "protein",
-    }
-
-    for prefix, seq_type in prefix_to_type.items():
-        if sequence_id.startswith(prefix):
-            return seq_type
-
-    raise InvalidSequenceTypeError(f"Unknown sequence type for input: {sequence_id}")
+    # Every supported prefix is exactly three characters ("NX_").
+    seq_type = _PREFIX_TO_TYPE.get(sequence_id[:3])
+    if seq_type is None:
+        raise InvalidSequenceTypeError(
+            f"Unknown sequence type for input: {sequence_id}"
+        )
+    return seq_type
 
 
+@lru_cache(maxsize=4096)
 def validate_accession(refseq_id: str) -> str:
     """Validate the given RefSeq ID to ensure it matches the expected format.
 
@@ -60,9 +72,7 @@ def validate_accession(refseq_id: str) -> str:
     Returns:
         str: The validated RefSeq ID.
     """
-    refseq_pattern = re.compile(r"^(NC_|NG_|NM_|NR_|NP_)\d+\.\d+$")
-
-    if not refseq_pattern.match(refseq_id):
+    if not _REFSEQ_RE.fullmatch(refseq_id):
         raise InvalidAccessionError(
             f"Invalid accession number: {refseq_id}. Must be a valid NCBI RefSeq ID (e.g., NM_000769.4)."
         )
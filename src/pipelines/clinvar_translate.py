@@ -1,16 +1,247 @@
 import argparse
+import contextlib
 import gzip
+import io
 import logging
+import multiprocessing
+import os
+import queue
+import threading
 import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
 import orjson
 from ga4gh.vrs.models import Allele
+from pydantic import TypeAdapter, ValidationError
 
 from translators.vrs_to_fhir_allele import VrsToFhirAlleleTranslator
 
+_READ_BUFFER_SIZE = 1 << 20
+_WRITE_BUFFER_SIZE = 1 << 20
+_BATCH_SIZE = 1000
+_WRITE_QUEUE_SIZE = 64
+_ALLELE_ADAPTER = TypeAdapter(Allele)
+_LSE = "LiteralSequenceExpression"
+_RLE = "ReferenceLengthExpression"
+
+# Each worker process builds its own translator on first use so the SeqRepo data proxy is never pickled.
+_translator = None
+
+
+def _get_translator():
+    global _translator
+    if _translator is None:
+        _translator = VrsToFhirAlleleTranslator()
+    return _translator
+
+
+def _init_worker(log_level):
+    """Apply the parent's log level in a worker process, which does not inherit the logging configuration."""
+    logging.basicConfig(level=log_level)
+
+
+def _encode_record(line_num, **fields):
+    """Encode a JSON Lines record from fields that are already serialized JSON bytes."""
+    parts = [b'{"line":', str(line_num).encode()]
+    for key, value in fields.items():
+        parts += (b',"', key.encode(), b'":', value)
+    parts.append(b"}\n")
+    return b"".join(parts)
+
+
+# Outcomes reported by _process_member.
+_INVALID_ALLELE = 0
+_TRANSLATED = 1
+_FAILED_TRANSLATION = 2
+
+
+def _process_member(
+    line_num: int, member: dict, translator: VrsToFhirAlleleTranslator
+) -> tuple[int, str | None, bytes]:
+    """Validate and translate a single VRS Allele member of a ClinVar record.
+
+    Args:
+        line_num (int): The input line the member came from.
+        member (dict): A decoded member whose type is "Allele".
+        translator (VrsToFhirAlleleTranslator): The translator for this process.
+
+    Returns:
+        tuple[int, str | None, bytes]: The outcome, the state count key ("lse_count", "rle_count", "other_count", or
+        None when validation failed), and the JSON Lines record to write for that outcome.
+    """
+    # Reject the common malformed shape up front instead of paying for a pydantic ValidationError.
+    if "location" not in member or "state" not in member:
+        invalid_allele: dict = {
+            "line": line_num,
+            "error": "Allele is missing a required 'location' or 'state' field",
+            "member": member,
+        }
+        return _INVALID_ALLELE, None, orjson.dumps(invalid_allele) + b"\n"
+    try:
+        vo: Allele = _ALLELE_ADAPTER.validate_python(member)
+    except (ValidationError, TypeError, ValueError) as e:
+        invalid_allele = {
+            "line": line_num,
+            "error": str(e),
+            "member": member,
+        }
+        return _INVALID_ALLELE, None, orjson.dumps(invalid_allele) + b"\n"
+
+    # state.type is a discriminator literal, so an exact comparison is enough.
+    state_type: str = vo.state.type
+    if state_type == _LSE:
+        state_key = "lse_count"
+    elif state_type == _RLE:
+        state_key = "rle_count"
+    else:
+        state_key = "other_count"
+
+    # Serialize the allele once; it is written on both the success and failure paths.
+    vo_json: bytes = _ALLELE_ADAPTER.dump_json(vo, exclude_none=True)
+
+    try:
+        fhir_obj = translator.translate(vo)
+        record = _encode_record(
+            line_num,
+            vrs_allele=vo_json,
+            fhir_allele=fhir_obj.model_dump_json(exclude_none=True).encode(),
+        )
+        return _TRANSLATED, state_key, record
+    except Exception as e:
+        record = _encode_record(
+            line_num, error=orjson.dumps(str(e)), vrs_allele=vo_json
+        )
+        return _FAILED_TRANSLATION, state_key, record
+
+
+def _translate_batch(lines: list[tuple[int, bytes]]):
+    """Validate and translate a batch of ClinVar JSONL lines.
+
+    Args:
+        lines (list[tuple[int, bytes]]): Pairs of (line number, raw JSON line).
+
+    Returns:
+        tuple: (translated, invalid_alleles, invalid_translations, stats) where the first three are lists of
+        JSON Lines records (bytes) and stats is a Counter of the summary counts for the batch.
+    """
+    translator = _get_translator()
+    translated: list[bytes] = []
+    invalid_alleles: list[bytes] = []
+    invalid_translations: list[bytes] = []
+    # Counts are kept in locals inside the loop and folded into a Counter once per batch.
+    lines_read = alleles_seen = failed_validation = failed_translation = 0
+    total_translated = lse_count = rle_count = other_count = 0
+
+    for line_num, line in lines:
+        lines_read += 1
+
+        try:
+            obj = orjson.loads(line)
+            members = obj.get("members", [])
+        except orjson.JSONDecodeError:
+            logging.warning("[Line %d] Skipping: JSON decode error", line_num)
+            continue
+
+        for member in members:
+            # orjson only produces plain dicts, so an identity check on the class is enough.
+            if member.__class__ is not dict:
+                continue
+            try:
+                if member["type"] != "Allele":
+                    continue
+            except KeyError:
+                continue
+            alleles_seen += 1
+
+            outcome, state_key, record = _process_member(line_num, member, translator)
+            if outcome == _INVALID_ALLELE:
+                failed_validation += 1
+                invalid_alleles.append(record)
+                continue
+
+            if state_key == "lse_count":
+                lse_count += 1
+            elif state_key == "rle_count":
+                rle_count += 1
+            else:
+                other_count += 1
+
+            if outcome == _TRANSLATED:
+                total_translated += 1
+                translated.append(record)
+            else:
+                failed_translation += 1
+                invalid_translations.append(record)
+
+    stats = Counter(
+        total_lines_read=lines_read,
+        vrs_allele_seen=alleles_seen,
+        failed_vrs_allele_validation=failed_validation,
+        failed_vrs_to_fhir_translation=failed_translation,
+        total_translated=total_translated,
+        lse_count=lse_count,
+        rle_count=rle_count,
+        other_count=other_count,
+    )
+    return translated, invalid_alleles, invalid_translations, stats
+
+
+class _BackgroundWriter:
+    """Write batches of JSON Lines records to a file from a daemon thread so disk I/O overlaps with translation."""
+
+    def __init__(self, f, maxsize=_WRITE_QUEUE_SIZE):
+        self._f = f
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._error = None
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def _drain(self):
+        while (lines := self._queue.get()) is not None:
+            if self._error is not None:
+                continue
+            try:
+                self._f.writelines(lines)
+            except Exception as e:
+                # Keep draining so producers never block on a full queue; the error is raised on close().
+                self._error = e
+
+    def writelines(self, lines):
+        if lines:
+            self._queue.put(lines)
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+        self._f.close()
+        if self._error is not None:
+            raise self._error
+
+
+def _read_batches(f, limit=None, batch_size=_BATCH_SIZE):
+    """Yield lists of (line number, line) pairs from an open input file."""
+    numbered = enumerate(f, 1)
+    if limit is not None:
+        numbered = islice(numbered, limit)
+    while batch := list(islice(numbered, batch_size)):
+        yield batch
+
+
+def _map_ordered(executor, fn, items, max_pending):
+    """Like executor.map, but keeps at most `max_pending` items in flight so large inputs are not queued at once."""
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
 
 @dataclass
 class ClinvarTranslationSummary:
@@ -30,129 +261,111 @@ class ClinvarTranslationSummary:
 
 
 class ClinvarTranslationPipeline:
-    def __init__(self):
-        self.vrs_to_fhir_translator = VrsToFhirAlleleTranslator()
-
     def run(
-        self, inputfile, outputfile, invalid_allele_path, invalid_fhir_path, limit=None
+        self,
+        inputfile,
+        outputfile,
+        invalid_allele_path,
+        invalid_fhir_path,
+        limit=None,
+        workers=None,
     ):
         started_at_wall = datetime.now()
         t0 = time.perf_counter()
+        workers = workers or os.cpu_count() or 1
 
-        invalid_allele_log = open(invalid_allele_path, "ab")
-        invalid_fhir_trans_log = open(invalid_fhir_path, "ab")
-        stats = open("runtime_stats.txt", "wb")
+        # Each writer is closed on exit even if closing another one re-raises its write error.
+        with contextlib.ExitStack() as writers:
+            invalid_allele_log = _BackgroundWriter(
+                open(invalid_allele_path, "ab", buffering=_WRITE_BUFFER_SIZE)
+            )
+            writers.callback(invalid_allele_log.close)
+            invalid_fhir_trans_log = _BackgroundWriter(
+                open(invalid_fhir_path, "ab", buffering=_WRITE_BUFFER_SIZE)
+            )
+            writers.callback(invalid_fhir_trans_log.close)
+            out_f = _BackgroundWriter(
+                open(outputfile, "ab", buffering=_WRITE_BUFFER_SIZE)
+            )
+            writers.callback(out_f.close)
+            stats = open("runtime_stats.txt", "wb")
 
-        total_translated = 0
-        failed_vrs_allele_validation = 0
-        failed_vrs_to_fhir_translation = 0
-        total_lines_read = 0
-        vrs_allele_seen = 0
-        allele_type = {"lse_count": 0, "rle_count": 0, "other_count": 0}
+            counts = Counter()
 
-        try:
-            with open(outputfile, "ab") as out_f:
-                with gzip.open(inputfile, "rt", encoding="utf-8") as f:
-                    for line_num, line in enumerate(f, 1):
-                        if limit is not None and line_num > limit:
-                            break
-
-                        total_lines_read += 1
-
-                        try:
-                            obj = orjson.loads(line)
-                            members = obj.get("members", [])
-                        except orjson.JSONDecodeError:
-                            logging.warning(
-                                "[Line %d] Skipping: JSON decode error", line_num
-                            )
-                            continue
-
-                        for member in members:
-                            if not (
-                                isinstance(member, dict)
-                                and member.get("type") == "Allele"
-                            ):
-                                continue
-                            vrs_allele_seen += 1
-                            try:
-                                vo = Allele(**member)
-
-                            except Exception as e:
-                                failed_vrs_allele_validation += 1
-
-                                invalid_allele = {
-                                    "line": line_num,
-                                    "error": str(e),
-                                    "member": member,
-                                }
-                                invalid_allele_log.write(
-                                    orjson.dumps(invalid_allele) + b"\n"
-                                )
-                                continue
-
-                            state_type = vo.state.type
-
-                            if "LiteralSequenceExpression" in state_type:
-                                allele_type["lse_count"] += 1
-                            elif "ReferenceLengthExpression" in state_type:
-                                allele_type["rle_count"] += 1
-                            else:
-                                allele_type["other_count"] += 1
-
-                            try:
-                                fhir_obj = self.vrs_to_fhir_translator.translate(
-                                    vo
-                                )
-
-                                valid_translation = {
-                                    "line": line_num,
-                                    "vrs_allele": vo.model_dump(exclude_none=True),
-                                    "fhir_allele": fhir_obj.model_dump(
-                                        exclude_none=True
-                                    ),
-                                }
-                                total_translated += 1
-                                out_f.write(orjson.dumps(valid_translation) + b"\n")
-
-                            except Exception as e:
-                                failed_vrs_to_fhir_translation += 1
-
-                                invalid_translation = {
-                                    "line": line_num,
-                                    "error": str(e),
-                                    "vrs_allele": vo.model_dump(exclude_none=True),
-                                }
-                                invalid_fhir_trans_log.write(
-                                    orjson.dumps(invalid_translation) + b"\n"
-                                )
-        finally:
-            t1 = time.perf_counter()
-            ended_at_wall = datetime.now()
-            duration = max(t1 - t0, 1e-9)
-
-            final_stats = ClinvarTranslationSummary(
-                file_name=Path(inputfile).name,
-                start_date=started_at_wall.date().isoformat(),
-                start_time=started_at_wall.time().isoformat(timespec="seconds"),
-                end_date=ended_at_wall.date().isoformat(),
-                end_time=ended_at_wall.time().isoformat(timespec="seconds"),
-                duration_seconds=round(duration, 2),
-                total_lines_read=total_lines_read,
-                vrs_allele_seen=vrs_allele_seen,
-                vrs_allele_types=allele_type,
-                total_translated=total_translated,
-                failed_vrs_allele_validation=failed_vrs_allele_validation,
-                failed_vrs_to_fhir_translation=failed_vrs_to_fhir_translation,
-                total_failed=failed_vrs_allele_validation
-                + failed_vrs_to_fhir_translation,
-            )
+            try:
+                # Lines stay as bytes: orjson parses them directly, so there is no per-line UTF-8 decode.
+                with io.BufferedReader(
+                    gzip.open(inputfile, "rb"), buffer_size=_READ_BUFFER_SIZE
+                ) as f:
+                    batches = _read_batches(f, limit=limit, batch_size=_BATCH_SIZE)
+
+                    if workers == 1:
+                        results = map(_translate_batch, batches)
+                        executor = None
+                    else:
+                        # The writer threads are already running, so workers must not be forked from this process.
+                        executor = ProcessPoolExecutor(
+                            max_workers=workers,
+                            mp_context=multiprocessing.get_context("forkserver"),
+                            initializer=_init_worker,
+                            initargs=(logging.getLogger().getEffectiveLevel(),),
+                        )
+                        results = _map_ordered(
+                            executor,
+                            _translate_batch,
+                            batches,
+                            max_pending=workers * 2,
+                        )
+
+                    try:
+                        for (
+                            translated,
+                            invalid_alleles,
+                            invalid_translations,
+                            batch_counts,
+                        ) in results:
+                            out_f.writelines(translated)
+                            invalid_allele_log.writelines(invalid_alleles)
+                            invalid_fhir_trans_log.writelines(invalid_translations)
+                            counts.update(batch_counts)
+                    finally:
+                        if executor is not None:
+                            executor.shutdown(cancel_futures=True)
+            finally:
+                t1 = time.perf_counter()
+                ended_at_wall = datetime.now()
+                duration = max(t1 - t0, 1e-9)
 
-            stats.write(orjson.dumps(final_stats, option=orjson.OPT_INDENT_2) + b"\n")
-            stats.close()
+                failed_vrs_allele_validation = counts["failed_vrs_allele_validation"]
+                failed_vrs_to_fhir_translation = counts[
+                    "failed_vrs_to_fhir_translation"
+                ]
 
-            invalid_allele_log.close()
-            invalid_fhir_trans_log.close()
+                final_stats = ClinvarTranslationSummary(
+                    file_name=Path(inputfile).name,
+                    start_date=started_at_wall.date().isoformat(),
+                    start_time=started_at_wall.time().isoformat(timespec="seconds"),
+                    end_date=ended_at_wall.date().isoformat(),
+                    end_time=ended_at_wall.time().isoformat(timespec="seconds"),
+                    duration_seconds=round(duration, 2),
+                    total_lines_read=counts["total_lines_read"],
+                    vrs_allele_seen=counts["vrs_allele_seen"],
+                    vrs_allele_types={
+                        "lse_count": counts["lse_count"],
+                        "rle_count": counts["rle_count"],
+                        "other_count": counts["other_count"],
+                    },
+                    total_translated=counts["total_translated"],
+                    failed_vrs_allele_validation=failed_vrs_allele_validation,
+                    failed_vrs_to_fhir_translation=failed_vrs_to_fhir_translation,
+                    total_failed=failed_vrs_allele_validation
+                    + failed_vrs_to_fhir_translation,
+                )
+
+                stats.write(
+                    orjson.dumps(final_stats, option=orjson.OPT_INDENT_2) + b"\n"
+                )
+                stats.close()
 
     def main(self):
         parser = argparse.ArgumentParser(
@@ -165,6 +378,11 @@ class ClinvarTranslationPipeline:
         parser.add_argument(
             "--limit", type=int, help="Process only this many lines from input"
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Number of worker processes (defaults to the CPU count, 1 runs in-process)",
+        )
         parser.add_argument(
             "--verbose", action="store_true", help="Enable detailed logging"
         )
@@ -180,6 +398,7 @@ class ClinvarTranslationPipeline:
             invalid_allele_path=args.invalid_allele_log,
             invalid_fhir_path=args.invalid_fhir_log,
             limit=args.limit,
+            workers=args.workers,
         )
 
 
@@ -1,3 +1,6 @@
+from functools import lru_cache
+from operator import attrgetter
+
 from ga4gh.core.models import Extension
 from ga4gh.vrs.models import (
     Allele,
@@ -20,6 +23,81 @@ from translators.constants.vrs_json_pointers import (
     sequence_reference_identifiers as SEQ_REF,
 )
 
+_ALLELE_PTR_ITEMS = tuple(ALLELE_PTRS.items())
+_ALLELE_SYSTEM_TO_KEY = {system_uri: key for key, system_uri in _ALLELE_PTR_ITEMS}
+
+
+def _allele_identifier_key(system):
+    """Return the Allele field an identifier system refers to, or None if it matches no pointer."""
+    key = _ALLELE_SYSTEM_TO_KEY.get(system)
+    if key is None:
+        # Systems are normally the exact pointer URI, but any system containing one has always been accepted.
+        for candidate, system_uri in _ALLELE_PTR_ITEMS:
+            if system_uri in system:
+                return candidate
+    return key
+
+
+_ext_url = attrgetter("url")
+_ext_children = attrgetter("extension")
+_ext_values = attrgetter("valueString", "valueBoolean", "valueDecimal", "valueInteger")
+
+# Pointer URIs bound once so the extractors do not re-subscript the pointer dicts per extension.
+_SEQ_LOC_NAME = SEQ_LOC["name"]
+_SEQ_LOC_DESCRIPTION = SEQ_LOC["description"]
+_SEQ_LOC_DIGEST = SEQ_LOC["digest"]
+_SEQ_LOC_ALIASES = SEQ_LOC["aliases"]
+
+_LSE_NAME = LSE["name"]
+_LSE_DESCRIPTION = LSE["description"]
+_LSE_ALIASES = LSE["aliases"]
+
+_SEQ_REF_ID = SEQ_REF["id"]
+_SEQ_REF_NAME = SEQ_REF["name"]
+_SEQ_REF_DESCRIPTION = SEQ_REF["description"]
+_SEQ_REF_ALIASES = SEQ_REF["aliases"]
+
+_EXTENSION_FIELD_URLS = tuple(
+    (field, EXT_PTRS[field]) for field in ("name", "value", "description")
+)
+_EXT_URL_TO_FIELD = {url: field for field, url in _EXTENSION_FIELD_URLS}
+
+
+def _extension_field(url):
+    """Return the Extension field a nested extension URL refers to, or None if it matches no pointer."""
+    field = _EXT_URL_TO_FIELD.get(url)
+    if field is None:
+        for candidate, candidate_url in _EXTENSION_FIELD_URLS:
+            if candidate_url in url:
+                return candidate
+    return field
+
+
+_CONTAINED_SEQUENCE_ID = "vrs-location-sequence"
+_CONTAINED_SEQUENCE_REFERENCE_ID = "vrs-location-sequenceReference"
+
+_RESIDUE_ALPHABET = {"dna": "na", "rna": "na", "amino acid": "aa"}
+_MAPPED_MOL_TYPE = {"dna": "genomic", "rna": "RNA", "amino acid": "protein"}
+
+
+@lru_cache(maxsize=16)
+def _infer_residue_alphabet(molecule_type):
+    """Return the residue alphabet for a FHIR molecule type code, or None if it is unrecognized."""
+    return _RESIDUE_ALPHABET.get(molecule_type)
+
+
+@lru_cache(maxsize=16)
+def _validate_molecule_type(molecule_type):
+    """Return the VRS molecule type for a FHIR molecule type, raising ValueError if it is unsupported."""
+    molecule_type = molecule_type.lower()
+
+    if molecule_type in _MAPPED_MOL_TYPE:
+        return _MAPPED_MOL_TYPE[molecule_type]
+
+    raise ValueError(
+        f"Unsupported moleculeType: '{molecule_type}'. Expected one of: dna, rna, amino acid."
+    )
+
 
 class FhirToVrsAlleleTranslator:
     """Translate a FHIR Allele Profile into a GA4GH VRS Allele, providing full translation."""
@@ -33,6 +111,8 @@ class FhirToVrsAlleleTranslator:
             Allele: A fully populated VRS 2.0 Allele object.
         """
         meta = self._extract_allele_metadata(ao)
+        # Walk the contained resources once and hand the results to the location and reference mappers.
+        sequence, sequence_reference = self._extract_contained_sequences(ao)
         return Allele(
             id=meta["id"],
             name=meta["name"],
@@ -41,7 +121,7 @@ class FhirToVrsAlleleTranslator:
             digest=meta["digest"],
             description=ao.description,
             expressions=self._map_expressions(ao),
-            location=self._map_sequence_location(ao),
+            location=self._map_sequence_location(ao, sequence, sequence_reference),
             state=self._map_literal_sequence_expression(ao),
         )
 
@@ -60,23 +140,24 @@ class FhirToVrsAlleleTranslator:
             - 'digest' (str): A computed digest or hash of the allele.
             - 'aliases' (list of str): A list of alternate identifiers for the allele.
         """
-        values = {"aliases": []}
+        found = {}
+        aliases = []
+        append_alias = aliases.append
 
         for identifier in ao.identifier:
-            for key, system_uri in ALLELE_PTRS.items():
-                if system_uri in identifier.system:
-                    if key == "aliases":
-                        values.setdefault("aliases", []).append(identifier.value)
-                    else:
-                        values[key] = identifier.value or None
-
-        for key in ["id", "name", "digest"]:
-            values.setdefault(key, None)
+            key = _allele_identifier_key(identifier.system)
+            if key == "aliases":
+                append_alias(identifier.value)
+            elif key is not None:
+                found[key] = identifier.value or None
 
-        if not values["aliases"]:
-            values["aliases"] = None
-
-        return values
+        return {
+            "id": None,
+            "name": None,
+            "digest": None,
+            **found,
+            "aliases": aliases or None,
+        }
 
     # ========== Expressions Mapping ==========
 
@@ -94,32 +175,32 @@ class FhirToVrsAlleleTranslator:
         if not ao.representation[0].code:
             return None
 
-        expression_list = []
-        for code in ao.representation[0].code:
-            extensions = (
-                self._extract_nested_extensions(code.extension)
-                if code.extension
-                else None
+        extract_nested = self._extract_nested_extensions
+        # The single-item inner loop evaluates each code's extensions once and shares them across its codings.
+        return [
+            Expression(
+                id=code.id,
+                syntax=coding.display,
+                value=coding.code,
+                syntax_version=coding.version,
+                extensions=extensions,
             )
-            for coding in code.coding:
-                exp = Expression(
-                    id=code.id,
-                    syntax=coding.display,
-                    value=coding.code,
-                    syntax_version=coding.version,
-                    extensions=extensions,
-                )
-                expression_list.append(exp)
-
-        return expression_list
+            for code in ao.representation[0].code
+            for extensions in [
+                extract_nested(code.extension) if code.extension else None
+            ]
+            for coding in code.coding
+        ]
 
     # ========== Sequence Location Mapping ==========
 
-    def _map_sequence_location(self, ao):
+    def _map_sequence_location(self, ao, sequence, sequence_reference):
         """Maps sequence location data from a FHIR Allele Profile to a VRS SequenceLocation object.
 
         Args:
             ao (AlleleObject): A FHIR Allele Profile object to be translated into a VRS 2.0 Allele.
+            sequence (object): The contained 'vrs-location-sequence' resource, or None.
+            sequence_reference (object): The contained 'vrs-location-sequenceReference' resource, or None.
 
         Returns:
             SequenceLocation: A VRS 2.0 `SequenceLocation` object with sequence reference, coordinates,
@@ -127,7 +208,6 @@ class FhirToVrsAlleleTranslator:
         """
         start, end = self._get_coordinates(ao)
         location_data = self._extract_location_fields(ao.location)
-        sequence, _ = self._extract_contained_sequences(ao)
         literal_sequence = self._extract_contained_sequence_value(sequence)
         mapped_extensions = self._map_extension(location_data["extensions"])
 
@@ -139,7 +219,7 @@ class FhirToVrsAlleleTranslator:
             digest=location_data["digest"],
             aliases=location_data["aliases"],
             type="SequenceLocation",
-            sequenceReference=self._map_sequence_reference(ao),
+            sequenceReference=self._map_sequence_reference(sequence_reference),
             start=start,
             end=end,
             sequence=literal_sequence,  # coming from contained value
@@ -157,16 +237,15 @@ class FhirToVrsAlleleTranslator:
         interval = ao.location[0].sequenceLocation.coordinateInterval
         return interval.startQuantity.value, interval.endQuantity.value
 
-    def _map_sequence_reference(self, ao):
+    def _map_sequence_reference(self, sequence_reference):
         """Maps sequence reference data from a FHIR Allele Profile to a VRS SequenceReference object.
 
         Args:
-            ao (AlleleObject): A FHIR Allele Profile object to be translated into a VRS 2.0 Allele.
+            sequence_reference (object): The contained 'vrs-location-sequenceReference' resource of a FHIR Allele Profile.
 
         Returns:
             SequenceReference: A fully populated VRS 2.0 `SequenceReference` object including identifiers, sequence string, and relevant extensions.
         """
-        _, sequence_reference = self._extract_contained_sequences(ao)
         ref_seq_data = self._extract_reference_sequence_fields(sequence_reference)
 
         mapped_extensions = self._map_extension(ref_seq_data["extensions"])
@@ -204,14 +283,10 @@ class FhirToVrsAlleleTranslator:
             - seq: The contained sequence object (e.g., for use in SequenceLocation).
             - seq_ref: The contained sequenceReference object (e.g., for use in SequenceReference).
         """
-        seq = None
-        seq_ref = None
-
-        for resource in ao.contained:
-            if resource.id == "vrs-location-sequence":
-                seq = resource
-            elif resource.id == "vrs-location-sequenceReference":
-                seq_ref = resource
+        # Later resources win on duplicate ids, as with the previous linear scan.
+        by_id = {resource.id: resource for resource in ao.contained}
+        seq = by_id.get(_CONTAINED_SEQUENCE_ID)
+        seq_ref = by_id.get(_CONTAINED_SEQUENCE_REFERENCE_ID)
 
         if seq is None and seq_ref is None:
             raise ValueError(
@@ -255,11 +330,10 @@ class FhirToVrsAlleleTranslator:
         residue_alphabet = None
         sequence = None
 
-        if hasattr(representation, "literal") and hasattr(
-            representation.literal, "encoding"
-        ):
-            residue_alphabet = representation.literal.encoding.coding[0].code
-            sequence = sequenceString(representation.literal.value)
+        literal = representation.literal
+        if literal is not None and literal.encoding is not None:
+            residue_alphabet = literal.encoding.coding[0].code
+            sequence = sequenceString(literal.value)
 
         if residue_alphabet is None:
             residue_alphabet = self._infer_residue_alphabet(molecule_type)
@@ -276,8 +350,7 @@ class FhirToVrsAlleleTranslator:
             str or None: Returns 'na' for nucleic acids (DNA or RNA), 'aa' for proteins,
         or None if the molecule type is unrecognized.
         """
-        residue_alphabet = {"dna": "na", "rna": "na", "amino acid": "aa"}
-        return residue_alphabet.get(molecule_type)
+        return _infer_residue_alphabet(molecule_type)
 
     def _validate_molecule_type(self, molecule_type):
         """Validates and converts a FHIR molecule type to its VRS-compliant equivalent.
@@ -292,16 +365,7 @@ class FhirToVrsAlleleTranslator:
         Returns:
             str: A molecule type string compatible with VRS. One of 'genomic', 'RNA', or 'protein'.
         """
-        mapped_mol_type = {"dna": "genomic", "rna": "RNA", "amino acid": "protein"}
-
-        molecule_type = molecule_type.lower()
-
-        if molecule_type in mapped_mol_type:
-            return mapped_mol_type[molecule_type]
-
-        raise ValueError(
-            f"Unsupported moleculeType: '{molecule_type}'. Expected one of: dna, rna, amino acid."
-        )
+        return _validate_molecule_type(molecule_type)
 
     # ========== Literal Sequence Expression Mapping ==========
 
@@ -341,7 +405,7 @@ class FhirToVrsAlleleTranslator:
 
     # ========== Extension Mapping ==========
     def _map_extension(self, ext_list):
-        """Recursively maps a list of extension dictionaries into Extension objects.
+        """Maps a list of extension dictionaries, including any nested ones, into Extension objects.
 
         Args:
             ext_list (list[dict]): A list of extension dictionaries, each with keys such as
@@ -350,61 +414,69 @@ class FhirToVrsAlleleTranslator:
         Returns:
             list[Extension] | None: A list of `Extension` objects representing the structured extensions, or `None` if the input list is empty or None.
         """
-        extension_objects = []
-        for ext in ext_list:
+        # Collect every extension in pre-order so each parent comes before its children, then build the
+        # Extension objects in reverse so children already exist when their parent is built.
+        nodes = []
+        stack = list(reversed(ext_list))
+        while stack:
+            ext = stack.pop()
+            nodes.append(ext)
+            exts = ext.get("extensions")
+            if exts:
+                stack.extend(reversed(exts))
+
+        built = {}
+        for ext in reversed(nodes):
             exts = ext.get("extensions")
-            sub_extensions = self._map_extension(exts) if exts else None
-            extension_objects.append(
-                Extension(
-                    id=ext.get("id"),
-                    name=ext.get("name"),
-                    value=ext.get("value"),
-                    description=ext.get("description"),
-                    extensions=sub_extensions,
-                )
+            built[id(ext)] = Extension(
+                id=ext.get("id"),
+                name=ext.get("name"),
+                value=ext.get("value"),
+                description=ext.get("description"),
+                extensions=[built[id(sub)] for sub in exts] if exts else None,
             )
-        return extension_objects or None
+        return [built[id(ext)] for ext in ext_list] or None
 
     def _extract_location_fields(self, location_obj):
-        """Extracts structured metadata from a list of FHIR location objects.
+        """Extracts structured metadata from the last of a list of FHIR location objects.
 
         Args:
             llocation_obj (list): A list of FHIR location objects, each potentially
             containing extensions that define metadata fields.
 
         Returns:
-            list[dict]: A list of dictionaries, one per location object, each containing: id,name, description, digest, aliases ,extensions
+            dict: A dictionary for the last location object, containing: id,name, description, digest, aliases ,extensions
         """
+        # Only the last location is mapped, so skip the extension walk for the others.
+        loc = location_obj[-1]
+        result = {
+            "id": loc.id,
+            "name": None,
+            "description": None,
+            "digest": None,
+            "aliases": [],
+            "extensions": [],
+        }
+
+        for ext in _ext_children(loc) or []:
+            url = _ext_url(ext) or ""
+            val = self._get_extension_value(ext)
 
-        for loc in location_obj:
-            result = {
-                "id": getattr(loc, "id", None),
-                "name": None,
-                "description": None,
-                "digest": None,
-                "aliases": [],
-                "extensions": [],
-            }
-
-            for ext in getattr(loc, "extension", None) or []:
-                url = getattr(ext, "url", "") or ""
-                val = self._get_extension_value(ext)
-
-                if SEQ_LOC["name"] in url:
-                    result["name"] = val
-                elif SEQ_LOC["description"] in url:
-                    result["description"] = val
-                elif SEQ_LOC["digest"] in url:
-                    result["digest"] = val
-                elif SEQ_LOC["aliases"] in url:
-                    result["aliases"].append(val)
-                elif ext.extension:
-                    nested = self._extract_nested_extensions([ext])
-                    if nested:
-                        result["extensions"].extend(nested)
-
-            if not result["aliases"]:
-                result["aliases"] = None
+            if _SEQ_LOC_NAME in url:
+                result["name"] = val
+            elif _SEQ_LOC_DESCRIPTION in url:
+                result["description"] = val
+            elif _SEQ_LOC_DIGEST in url:
+                result["digest"] = val
+            elif _SEQ_LOC_ALIASES in url:
+                result["aliases"].append(val)
+            elif ext.extension:
+                nested = self._extract_nested_extensions([ext])
+                if nested:
+                    result["extensions"].extend(nested)
+
+        if not result["aliases"]:
+            result["aliases"] = None
 
         return result
 
@@ -416,38 +488,43 @@ class FhirToVrsAlleleTranslator:
             potentially containing a `literal` element with structured metadata
             in extensions.
 
+        Raises:
+            ValueError: If none of the representations has a `literal` element.
+
         Returns:
            dict: A dictionary representing the last literal sequence expression found.
         Includes the fields: id, name, description, aliases, and extensions.
         """
+        # Only the last literal is mapped, so find it from the end instead of walking every representation.
+        for rep in reversed(representation_obj):
+            literal = rep.literal
+            if literal is not None:
+                break
+        else:
+            raise ValueError("No literal representation found.")
 
-        for rep in representation_obj:
-            literal = getattr(rep, "literal", None)
-            if literal is None:
-                continue
+        result = {
+            "id": literal.id,
+            "name": None,
+            "description": None,
+            "aliases": [],
+            "extensions": [],
+        }
 
-            result = {
-                "id": getattr(rep.literal, "id", None),
-                "name": None,
-                "description": None,
-                "aliases": [],
-                "extensions": [],
-            }
-
-            for ext in getattr(literal, "extension", None) or []:
-                url = getattr(ext, "url", "") or ""
-                val = self._get_extension_value(ext)
-
-                if LSE["name"] in url:
-                    result["name"] = val
-                elif LSE["description"] in url:
-                    result["description"] = val
-                elif LSE["aliases"] in url:
-                    result["aliases"].append(val)
-                elif ext.extension:
-                    nested = self._extract_nested_extensions([ext])
-                    if nested:
-                        result["extensions"].extend(nested)
+        for ext in _ext_children(literal) or []:
+            url = _ext_url(ext) or ""
+            val = self._get_extension_value(ext)
+
+            if _LSE_NAME in url:
+                result["name"] = val
+            elif _LSE_DESCRIPTION in url:
+                result["description"] = val
+            elif _LSE_ALIASES in url:
+                result["aliases"].append(val)
+            elif ext.extension:
+                nested = self._extract_nested_extensions([ext])
+                if nested:
+                    result["extensions"].extend(nested)
 
         if not result["aliases"]:
             result["aliases"] = None
@@ -473,19 +550,19 @@ class FhirToVrsAlleleTranslator:
             "extensions": [],
         }
 
-        for ext in getattr(ref_seq, "extension", None) or []:
-            url = getattr(ext, "url", "") or ""
+        for ext in _ext_children(ref_seq) or []:
+            url = _ext_url(ext) or ""
             val = self._get_extension_value(ext)
 
-            if SEQ_REF["id"] in url:
+            if _SEQ_REF_ID in url:
                 result["id"] = val
-            if SEQ_REF["name"] in url:
+            if _SEQ_REF_NAME in url:
                 result["name"] = val
-            elif SEQ_REF["description"] in url:
+            elif _SEQ_REF_DESCRIPTION in url:
                 result["description"] = val
-            elif SEQ_REF["aliases"] in url:
+            elif _SEQ_REF_ALIASES in url:
                 result["aliases"].append(val)
-            elif hasattr(ext, "extension"):
+            else:
                 nested = self._extract_nested_extensions([ext])
                 if nested:
                     result["extensions"].extend(nested)
@@ -496,7 +573,7 @@ class FhirToVrsAlleleTranslator:
         return result
 
     def _extract_nested_extensions(self, extension_list):
-        """Recursively extracts structured metadata from nested FHIR extensions.
+        """Extracts structured metadata from nested FHIR extensions.
 
         Args:
             extension_list (list): A list of FHIR extension objects.
@@ -506,35 +583,35 @@ class FhirToVrsAlleleTranslator:
         """
         results = []
 
-        for ext in extension_list:
-            ext_id = getattr(ext, "id", None)
-            result = {"id": ext_id}
-            inner_extensions = getattr(ext, "extension", [])
+        # Walk the extension tree with an explicit stack. Each entry pairs an extension with the parsed parent it
+        # belongs under (None at the top level); children are pushed in reverse so siblings keep their order.
+        stack = [(ext, None) for ext in reversed(extension_list)]
+        while stack:
+            ext, parent = stack.pop()
+            inner_extensions = _ext_children(ext)
 
             if (
                 inner_extensions is None
             ):  # to avoid extensions that are none. Prefer to find a better solution.
                 continue
 
-            nested_ext = []
+            result = {"id": ext.id}
+            children = []
 
             for inner_ext in inner_extensions:
-                inner_url = getattr(inner_ext, "url", "") or ""
-                inner_val = self._get_extension_value(inner_ext)
-
-                if EXT_PTRS["name"] in inner_url:
-                    result["name"] = inner_val
-                elif EXT_PTRS["value"] in inner_url:
-                    result["value"] = inner_val
-                elif EXT_PTRS["description"] in inner_url:
-                    result["description"] = inner_val
-                elif hasattr(inner_ext, "extension"):
-                    nested_ext.extend(self._extract_nested_extensions([inner_ext]))
+                inner_url = _ext_url(inner_ext) or ""
+                field = _extension_field(inner_url)
 
-            if nested_ext:
-                result["extensions"] = nested_ext
+                if field is not None:
+                    result[field] = self._get_extension_value(inner_ext)
+                else:
+                    children.append(inner_ext)
 
-            results.append(result)
+            if parent is None:
+                results.append(result)
+            else:
+                parent.setdefault("extensions", []).append(result)
+            stack.extend((child, result) for child in reversed(children))
 
         return results
 
@@ -553,8 +630,7 @@ class FhirToVrsAlleleTranslator:
         Returns:
             Union[str, bool, float, None]: The first available value found, or None if none are set.
         """
-        for attr in ["valueString", "valueBoolean", "valueDecimal", "valueInteger"]:
-            val = getattr(ext, attr, None)
+        for val in _ext_values(ext):
             if val is not None:
                 return val
         return None
@@ -1,11 +1,9 @@
-import re
+import string
 from decimal import Decimal
+from typing import NamedTuple
 
-from fhir.resources.codeableconcept import CodeableConcept
-from fhir.resources.coding import Coding
 from fhir.resources.quantity import Quantity
 from fhir.resources.reference import Reference
-from ga4gh.vrs.dataproxy import create_dataproxy
 from ga4gh.vrs.models import (
     Allele,
     LiteralSequenceExpression,
@@ -19,12 +17,18 @@ from resources.moleculardefinition import (
     MolecularDefinitionLocation,
     MolecularDefinitionLocationSequenceLocation,
     MolecularDefinitionLocationSequenceLocationCoordinateInterval,
-    MolecularDefinitionLocationSequenceLocationCoordinateIntervalCoordinateSystem,
     MolecularDefinitionRepresentation,
     MolecularDefinitionRepresentationLiteral,
 )
 
-from conventions.coordinate_systems import vrs_coordinate_interval
+from conventions.coordinate_systems import vrs_coordinate_system
+from conventions.fhir_codes import (
+    ALLELE_STATE_FOCUS,
+    SEQUENCE_TYPE_SYSTEM,
+    focus_concept,
+    molecule_type_concept,
+    refseq_code_concept,
+)
 from conventions.refseq_identifiers import (
     detect_sequence_type,
     refseq_to_fhir_id,
@@ -32,17 +36,46 @@ from conventions.refseq_identifiers import (
     validate_accession,
 )
 from translators.validations.allele import validate_allele_profile, validate_vrs_allele
-from translators.validations.indexing import apply_indexing
+from translators.validations.indexing import (
+    apply_indexing,
+    coordinate_system_from_display,
+)
+from vrs_tools.dataproxy import CachingDataProxy, get_dataproxy
 from vrs_tools.normalizer import VariantNormalizer
 
+# Every valid VRS sequence character; deleting them from an ASCII sequence must leave nothing behind.
+_SEQUENCE_ALPHABET = (string.ascii_uppercase + "*-").encode("ascii")
+
+
+def _sequence_profile(refseq_id):
+    """Build the contained FHIR Sequence that an allele on the given RefSeq accession points at."""
+    return FhirSequence(
+        id=f"ref-to-{refseq_to_fhir_id(refseq_accession=refseq_id)}",
+        moleculeType=molecule_type_concept(
+            SEQUENCE_TYPE_SYSTEM, detect_sequence_type(refseq_id)
+        ),
+        representation=[
+            MolecularDefinitionRepresentation(code=[refseq_code_concept(refseq_id)])
+        ],
+    )
+
+
+class _SequenceLocationValues(NamedTuple):
+    """Values read from a FHIR sequence location while it is validated."""
+
+    codings: list
+    start_value: Decimal
+    end_value: Decimal
+
+
 class MinimalFhirAlleleToVrsAlleleTranslator:
     """Provide minimal translation from a FHIR Allele Profile to a VRS Allele object."""
     def __init__(self, dp=None, uri: str | None = None):
-        self.dp = dp or create_dataproxy(uri=uri)
-        self.service = VariantNormalizer(dp=self.dp)
-        self.allele_denormalizer = VariantNormalizer(dp=self.dp)
+        self.dp = CachingDataProxy(dp or get_dataproxy(uri=uri))
+        self.service = self.allele_denormalizer = VariantNormalizer(dp=self.dp)
 
-    def _is_valid_sequence_location(self, locations):
+    @staticmethod
+    def _is_valid_sequence_location(locations):
         """Validates the `sequenceLocation` structure within the provided locations to ensure all necessary attributes are present for accurate translations.
 
         Args:
@@ -57,7 +90,8 @@ class MinimalFhirAlleleToVrsAlleleTranslator:
             ValueError: If 'endQuantity.value' is missing in any coordinate interval.
 
         Returns:
-            sequence_location: The validated sequence location object.
+            _SequenceLocationValues: The coordinate system codings and the start and end values of the validated
+                sequence location.
 
         """
         for loc in locations:
@@ -66,36 +100,39 @@ class MinimalFhirAlleleToVrsAlleleTranslator:
             if not sequence_location:
                 raise ValueError("Missing 'sequenceLocation' in location.")
             # Check coordinateInterval existence
-            if not sequence_location.coordinateInterval:
-                raise ValueError("Missing 'coordinateInterval' in sequence location.")
-
             coordinate_interval = sequence_location.coordinateInterval
+            if not coordinate_interval:
+                raise ValueError("Missing 'coordinateInterval' in sequence location.")
 
             # Check coordinateSystem.system.coding
-            if not coordinate_interval.coordinateSystem.system.coding:
+            codings = coordinate_interval.coordinateSystem.system.coding
+            if not codings:
                 raise ValueError(
                     "Missing 'coordinateSystem.system.coding' in coordinate interval."
                 )
 
-            if not any(
-                coding.display
-                for coding in coordinate_interval.coordinateSystem.system.coding
-            ):
+            for coding in codings:
+                if coding.display:
+                    break
+            else:
                 raise ValueError(
                     "Missing 'coding.display' in 'coordinateSystem.system.coding'."
                 )
 
             # Check startQuantity and endQuantity
-            if not getattr(coordinate_interval.startQuantity, "value", None):
+            start_value = getattr(coordinate_interval.startQuantity, "value", None)
+            if not start_value:
                 raise ValueError(
                     "Missing 'startQuantity.value' in coordinate interval."
                 )
-            if not getattr(coordinate_interval.endQuantity, "value", None):
+            end_value = getattr(coordinate_interval.endQuantity, "value", None)
+            if not end_value:
                 raise ValueError("Missing 'endQuantity.value' in coordinate interval.")
 
-        return sequence_location
+        return _SequenceLocationValues(codings, start_value, end_value)
 
-    def _convert_decimal_to_int(self, value):
+    @staticmethod
+    def _convert_decimal_to_int(value):
         """Validate and convert a Decimal value to an integer if possible.
 
         Args:
@@ -112,15 +149,15 @@ class MinimalFhirAlleleToVrsAlleleTranslator:
         if not isinstance(value, Decimal):
             raise TypeError("Value is not a valid Decimal value.")
 
-        if value == value.to_integral_value():
-            value = int(value)
-        else:
-            raise TypeError(
-                "Decimal Value must be able to be converted into an Integer"
-            )
-        return value
+        # Inspect the digit tuple rather than building a second Decimal with to_integral_value().
+        # A negative exponent is still integral when every fractional digit is zero (e.g., Decimal("5.0")).
+        _, digits, exponent = value.as_tuple()
+        if isinstance(exponent, int) and (exponent >= 0 or not any(digits[exponent:])):
+            return int(value)
+        raise TypeError("Decimal Value must be able to be converted into an Integer")
 
-    def _validate_sequence(self, sequence):
+    @staticmethod
+    def _validate_sequence(sequence):
         """Validate the sequence to ensure it contains valid characters as per VRS rules.
 
         Args:
@@ -133,12 +170,16 @@ class MinimalFhirAlleleToVrsAlleleTranslator:
             str: The validated sequence.
 
         """
-        pattern = r"^[A-Z*\-]*$"
-        if not re.match(pattern, sequence):
+        # bytes.translate deletes through a flat 256-entry table, several times faster than str.translate on long
+        # sequences; the isascii() guard keeps non-ASCII input from reaching encode().
+        if not sequence.isascii() or sequence.encode("ascii").translate(
+            None, _SEQUENCE_ALPHABET
+        ):
             raise ValueError("Invalid sequence value")
         return sequence
 
-    def _get_literal_value_for_allele_state(self, representations):
+    @staticmethod
+    def _get_literal_value_for_allele_state(representations):
         """Retrieves the literal value associated with an `allele-state` representation, if present, from the provided list of representations.
 
         Args:
@@ -152,19 +193,20 @@ class MinimalFhirAlleleToVrsAlleleTranslator:
 
         """
         for rep in representations:
-            focus = getattr(rep, "focus", None)
-            if focus and any(
-                coding.code == "allele-state" for coding in getattr(focus, "coding", [])
-            ):
-                literal = getattr(rep, "literal", None)
-                if literal:
+            focus = rep.focus
+            if focus is None:
+                continue
+            for coding in focus.coding or ():
+                if coding.code == "allele-state":
+                    literal = rep.literal
+                    if literal is None:
+                        raise ValueError(
+                            "Missing `literal.value` for the `allele-state` representation."
+                        )
                     return literal.value
-                else:
-                    raise ValueError(
-                        "Missing `literal.value` for the `allele-state` representation."
-                    )
 
-    def _validate_and_extract_code(self, expression):
+    @staticmethod
+    def _validate_and_extract_code(expression):
         if not expression.contained:
             raise ValueError("Missing 'contained' field.")
 
@@ -184,7 +226,7 @@ class MinimalFhirAlleleToVrsAlleleTranslator:
 
         return validate_accession(code_item.coding[0].code)
 
-    def translate(self, expression, normalize=True):
+    def translate(self, expression, normalize=True, trust_input=False):
         """Converts an FHIR Allele Profile object into a GA4GH VRS Allele object.
 
         Args:
@@ -192,6 +234,8 @@ class MinimalFhirAlleleToVrsAlleleTranslator:
                 representation, and other metadata required for conversion.
             normalize (bool, optional): If True, returns a normalized VRS Allele using the VRS normalizer.
                 Defaults to True.
+            trust_input (bool, optional): If True, builds the VRS models from the values validated here without
+                re-running pydantic validation. Defaults to False.
 
         Raises:
             ValueError: Raised if multiple codings are found in the coordinate system or if the
@@ -200,36 +244,121 @@ class MinimalFhirAlleleToVrsAlleleTranslator:
         Returns:
             models.Allele: A GA4GH VRS Allele object.
         """
+        refseq_id, start_pos, end_pos, alt_seq = self._extract_fhir_values(expression)
+        refget_accession = self.dp.derive_refget_accession(f"refseq:{refseq_id}")
+        allele = self._build_vrs_allele(
+            refget_accession.removeprefix("refget:"),
+            start_pos,
+            end_pos,
+            alt_seq,
+            trust_input,
+        )
+
+        return self.service.normalize(allele) if normalize else allele
+
+    def translate_many(self, expressions, normalize=True, trust_input=False):
+        """Converts a batch of FHIR Allele Profile objects into GA4GH VRS Allele objects.
+
+        Every profile is validated and its values extracted before any SeqRepo lookups are made, and each distinct
+        RefSeq accession is resolved to its refget accession only once for the whole batch.
+
+        Args:
+            expressions (Iterable[Allele]): FHIR-compliant Alleles to convert.
+            normalize (bool, optional): If True, returns normalized VRS Alleles using the VRS normalizer.
+                Defaults to True.
+            trust_input (bool, optional): If True, builds the VRS models from the values validated here without
+                re-running pydantic validation. Defaults to False.
+
+        Raises:
+            ValueError: Raised if any profile has multiple codings in its coordinate system or an unsupported
+                coordinate system.
+
+        Returns:
+            list[models.Allele]: The GA4GH VRS Alleles, in input order.
+        """
+        extracted = [
+            self._extract_fhir_values(expression) for expression in expressions
+        ]
+
+        refget_accessions = {}
+        for refseq_id, _, _, _ in extracted:
+            if refseq_id not in refget_accessions:
+                refget_accessions[refseq_id] = self.dp.derive_refget_accession(
+                    f"refseq:{refseq_id}"
+                ).removeprefix("refget:")
+
+        alleles = []
+        for refseq_id, start_pos, end_pos, alt_seq in extracted:
+            allele = self._build_vrs_allele(
+                refget_accessions[refseq_id], start_pos, end_pos, alt_seq, trust_input
+            )
+            alleles.append(self.service.normalize(allele) if normalize else allele)
+        return alleles
+
+    def _extract_fhir_values(self, expression):
+        """Validate a FHIR Allele Profile and extract the values needed to build a VRS Allele.
+
+        Args:
+            expression (Allele): A FHIR-compliant Allele.
+
+        Raises:
+            ValueError: Raised if multiple codings are found in the coordinate system or if the
+                coordinate system is unsupported.
+
+        Returns:
+            tuple: (refseq_id, start_pos, end_pos, alt_seq) with 0-based interbase positions.
+        """
         validate_allele_profile(expression)
 
-        location_data = self._is_valid_sequence_location(expression.location)
+        coding_list, start_value, end_value = self._is_valid_sequence_location(
+            expression.location
+        )
 
-        values_needed = {
-            "refseq": self._validate_and_extract_code(expression),
-            "start": location_data.coordinateInterval.startQuantity.value,
-            "end": location_data.coordinateInterval.endQuantity.value,
-        }
+        refseq_id = self._validate_and_extract_code(expression)
 
-        coding_list = location_data.coordinateInterval.coordinateSystem.system.coding
         if len(coding_list) != 1:
             raise ValueError("Only one coding supported in coordinateSystem.")
 
-        values_needed["coordinate_system_display"] = coding_list[0].display
+        coord_system = coordinate_system_from_display(coding_list[0].display)
 
         seq = self._get_literal_value_for_allele_state(expression.representation)
-        start = apply_indexing(
-            values_needed["coordinate_system_display"], values_needed["start"]
-        )
+        start = apply_indexing(coord_system, start_value)
         start_pos = self._convert_decimal_to_int(start)
-        end_pos = self._convert_decimal_to_int(values_needed["end"])
+        end_pos = self._convert_decimal_to_int(end_value)
         alt_seq = self._validate_sequence(seq)
 
-        refget_accession = self.dp.derive_refget_accession(
-            f"refseq:{values_needed['refseq']}"
-        )
-        seq_ref = SequenceReference(
-            refgetAccession=refget_accession.split("refget:")[-1]
-        )
+        return refseq_id, start_pos, end_pos, alt_seq
+
+    @staticmethod
+    def _build_vrs_allele(
+        refget_accession, start_pos, end_pos, alt_seq, trust_input=False
+    ):
+        """Build an unnormalized VRS Allele from already validated values.
+
+        Args:
+            refget_accession (str): The refget accession of the reference sequence (e.g., 'SQ.abc').
+            start_pos (int): The 0-based interbase start.
+            end_pos (int): The 0-based interbase end.
+            alt_seq (str): The literal allele sequence.
+            trust_input (bool, optional): If True, skips pydantic validation of the VRS models. Defaults to False.
+
+        Returns:
+            models.Allele: A GA4GH VRS Allele object.
+        """
+        if trust_input:
+            # The values were validated by _extract_fhir_values and _validate_sequence.
+            seq_ref = SequenceReference.model_construct(
+                refgetAccession=refget_accession
+            )
+            seq_location = SequenceLocation.model_construct(
+                sequenceReference=seq_ref, start=start_pos, end=end_pos
+            )
+            lit_seq_expr = LiteralSequenceExpression.model_construct(
+                sequence=sequenceString.model_construct(alt_seq)
+            )
+            return Allele.model_construct(location=seq_location, state=lit_seq_expr)
+
+        seq_ref = SequenceReference(refgetAccession=refget_accession)
 
         seq_location = SequenceLocation(
             sequenceReference=seq_ref,
@@ -237,17 +366,14 @@ class MinimalFhirAlleleToVrsAlleleTranslator:
             end=end_pos,
         )
         lit_seq_expr = LiteralSequenceExpression(sequence=sequenceString(alt_seq))
-        allele = Allele(location=seq_location, state=lit_seq_expr)
-
-        return self.service.normalize(allele) if normalize else allele
+        return Allele(location=seq_location, state=lit_seq_expr)
 
 
 class MinimalVrsAlleleToFhirAlleleTranslator:
     """Provide minimal translation from a FHIR Allele Profile to a VRS Allele object."""
     def __init__(self, dp=None, uri: str | None = None):
-        self.dp = dp or create_dataproxy(uri=uri)
-        self.service = VariantNormalizer(dp=self.dp)
-        self.allele_denormalizer = VariantNormalizer(dp=self.dp)
+        self.dp = CachingDataProxy(dp or get_dataproxy(uri=uri))
+        self.service = self.allele_denormalizer = VariantNormalizer(dp=self.dp)
 
     def _extract_vrs_values(self, expression, dp):
         """Extract GA4GH ID, RefSeq ID, start, end, and sequence from a VRS Allele.
@@ -264,7 +390,7 @@ class MinimalVrsAlleleToFhirAlleleTranslator:
         refgetAccession = translate_sequence_id(dp, expression)
         start_pos = expression.location.start
         end_pos = expression.location.end
-        alt_allele = expression.state.sequence.model_dump()
+        alt_allele = expression.state.sequence.root
 
         return refgetAccession, start_pos, end_pos, alt_allele
 
@@ -292,62 +418,24 @@ class MinimalVrsAlleleToFhirAlleleTranslator:
             expression, self.dp
         )
 
-        sequence_type = detect_sequence_type(refgetAccession)
+        sequence_profile = _sequence_profile(refgetAccession)
 
-        mol_type = CodeableConcept(
-            coding=[
-                Coding(
-                    system="http://hl7.org/fhir/sequence-type",
-                    code=sequence_type.lower(),
-                    display=f"{sequence_type} Sequence",
-                )
-            ]
-        )
+        start_quant = Quantity.model_construct(value=Decimal(int(start_pos)))
+        end_quant = Quantity.model_construct(value=Decimal(int(end_pos)))
 
-        coding_ref = Coding(
-            system="http://www.ncbi.nlm.nih.gov/refseq",
-            code=refgetAccession,
-            # display="TBD-THIS IS A DEMO EXAMPLE"
-        )
-
-        code_value = CodeableConcept(coding=[coding_ref])
-        representation_sequence = MolecularDefinitionRepresentation(code=[code_value])
-
-        fhir_id = refseq_to_fhir_id(refseq_accession=refgetAccession)
-
-        sequence_profile = FhirSequence(
-            id=f"ref-to-{fhir_id}",
-            moleculeType=mol_type,
-            representation=[representation_sequence],
-        )
-
-        start_quant = Quantity(value=int(start_pos))
-        end_quant = Quantity(value=int(end_pos))
-
-        system, origin, normalizationMethod = vrs_coordinate_interval()
-
-        seq_context = Reference(
+        seq_context = Reference.model_construct(
             reference=f"#{sequence_profile.id}", type="MolecularDefinition"
         )
-        focus_value = CodeableConcept(
-            coding=[
-                Coding(
-                    system="http://hl7.org/fhir/moleculardefinition-focus",
-                    code="allele-state",
-                    display="Allele State",
-                )
-            ]
-        )
 
-        moldef_literal = MolecularDefinitionRepresentationLiteral(value=str(alt_allele))
+        moldef_literal = MolecularDefinitionRepresentationLiteral.model_construct(
+            value=alt_allele
+        )
 
         moldef_repr = MolecularDefinitionRepresentation(
-            focus=focus_value, literal=moldef_literal
+            focus=focus_concept(ALLELE_STATE_FOCUS), literal=moldef_literal
         )
 
-        coord_system_fhir = MolecularDefinitionLocationSequenceLocationCoordinateIntervalCoordinateSystem(
-            system=system, origin=origin, normalizationMethod=normalizationMethod
-        )
+        coord_system_fhir = vrs_coordinate_system()
         coord_interval = MolecularDefinitionLocationSequenceLocationCoordinateInterval(
             coordinateSystem=coord_system_fhir,
             startQuantity=start_quant,
@@ -362,9 +450,68 @@ class MinimalVrsAlleleToFhirAlleleTranslator:
 
         return FhirAllele(
             contained=[sequence_profile],
-            moleculeType=mol_type,
+            moleculeType=molecule_type_concept(
+                SEQUENCE_TYPE_SYSTEM, detect_sequence_type(refgetAccession)
+            ),
             location=[location],
             representation=[moldef_repr],
         )
 
+    def translate_fast(self, expression):
+        """Converts an GA4GH VRS Allele object into FHIR Allele object with a single validation pass.
+
+        Instead of validating each MolecularDefinition element as it is built, the per-allele values are patched into
+        a JSON-shaped template whose fixed parts are prebuilt FHIR elements, and the whole Allele is validated once
+        with `model_validate`. The contained Sequence is built by the same helper `translate` uses.
+
+        Args:
+            expression (Allele): A VRS Allele object containing refgetAccession, start and end position, and alternative sequence.
+
+        Raises:
+            InvalidVRSAlleleError: Raised if the input is not a valid VRS Allele object.
+
+        Returns:
+            FhirAllele: The translated FHIR Allele Profile representation.
+        """
+        validate_vrs_allele(expression)
+
+        if expression.state.type == "ReferenceLengthExpression":
+            expression = self.allele_denormalizer.denormalize_reference_length(
+                expression
+            )
+
+        refgetAccession, start_pos, end_pos, alt_allele = self._extract_vrs_values(
+            expression, self.dp
+        )
+        sequence_profile = _sequence_profile(refgetAccession)
+
+        return FhirAllele.model_validate(
+            {
+                "contained": [sequence_profile],
+                "moleculeType": molecule_type_concept(
+                    SEQUENCE_TYPE_SYSTEM, detect_sequence_type(refgetAccession)
+                ),
+                "location": [
+                    {
+                        "sequenceLocation": {
+                            "sequenceContext": {
+                                "reference": f"#{sequence_profile.id}",
+                                "type": "MolecularDefinition",
+                            },
+                            "coordinateInterval": {
+                                "coordinateSystem": vrs_coordinate_system(),
+                                "startQuantity": {"value": int(start_pos)},
+                                "endQuantity": {"value": int(end_pos)},
+                            },
+                        }
+                    }
+                ],
+                "representation": [
+                    {
+                        "focus": focus_concept(ALLELE_STATE_FOCUS),
+                        "literal": {"value": alt_allele},
+                    }
+                ],
+            }
+        )
 
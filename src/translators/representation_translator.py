@@ -1,17 +1,16 @@
-from ga4gh.vrs.dataproxy import create_dataproxy
-
 from resources.moleculardefinition import (
     MolecularDefinitionRepresentation,
     MolecularDefinitionRepresentationLiteral,
 )
 from translators.validations.indexing import apply_indexing
+from vrs_tools.dataproxy import CachingDataProxy, coalesce_ranges, get_dataproxy
 
 
 class RepresentationTranslator:
     """A class to handle the translation between HL7 FHIR Molecular Definition Representations, including extracted, repeated, and relative representations, into literal representations. Currently, RepresentationTranslator can only handle extracted and repeated representations."""
 
     def __init__(self, dp=None, uri: str | None = None):
-        self.dp = dp or create_dataproxy(uri=uri)
+        self.dp = CachingDataProxy(dp or get_dataproxy(uri=uri))
 
     def _validate_representation(self, expression):
         """Validate that the MolecularDefinition contains a representation attribute.
@@ -25,7 +24,7 @@ class RepresentationTranslator:
         Returns:
             list: The representation associated with the MolecularDefinition.
         """
-        if not hasattr(expression, "representation"):
+        if getattr(expression, "representation", None) is None:
             raise ValueError(
                 "MolecularDefinition Object does not contain representation attribute"
             )
@@ -46,26 +45,81 @@ class RepresentationTranslator:
             object: Expression: The updated expression with the literal sequence representation appended.
 
         """
+        return self.translate_extracted_to_literal_batch([expression])[0]
+
+    def translate_extracted_to_literal_batch(self, expressions):
+        """Translates the extracted sequence representations of many expressions to literal sequence representations.
+
+        Requested ranges are grouped by sequence ID and overlapping or adjacent ranges are merged, so SeqRepo is asked
+        for each merged span once and the individual literals are sliced from it.
+
+        Args:
+            expressions (list): The expressions containing the representations to be translated.
+
+        Raises:
+            ValueError: If any expression does not have exactly one extracted sequence in its representation.
+            ValueError: If a 'startingMolecule' does not contain a 'display' for the sequence ID.
+            ValueError: If a sequence cannot be retrieved from SeqRepo.
+
+        Returns:
+            list: The updated expressions, in input order, each with its literal sequence representation appended.
+
+        """
+        ranges_by_sequence = {}
+        for index, expression in enumerate(expressions):
+            sequence_id, start, end = self._extracted_range(expression)
+            ranges_by_sequence.setdefault(sequence_id, []).append((start, end, index))
+
+        literal_seqs = [None] * len(expressions)
+        for sequence_id, ranges in ranges_by_sequence.items():
+            for span_start, span_end, span_ranges in coalesce_ranges(ranges):
+                self._fill_from_span(
+                    sequence_id, span_start, span_end, span_ranges, literal_seqs
+                )
+
+        for expression, literal_seq in zip(expressions, literal_seqs):
+            literal = MolecularDefinitionRepresentation(
+                literal=MolecularDefinitionRepresentationLiteral(value=literal_seq)
+            )
+            expression.representation.append(literal)
+            # expression.representation.insert(0, literal)
+        return expressions
+
+    def _extracted_range(self, expression):
+        """Read the sequence ID and 0-based interbase range of an expression's single extracted representation.
+
+        Args:
+            expression (object): The expression containing the representations to be translated.
+
+        Raises:
+            ValueError: If there is not exactly one extracted sequence in the representation.
+            ValueError: If the 'startingMolecule' does not contain a 'display' for the sequence ID.
+
+        Returns:
+            tuple: (sequence_id, start, end)
+        """
         representations = self._validate_representation(expression)
-        extracted_list = []
+        extracted = None
+        count = 0
         for rep in representations:
-            if hasattr(rep, "extracted") and rep.extracted is not None:
-                extracted_list.append(rep.extracted)
-
-        if len(extracted_list) != 1:
+            rep_extracted = rep.extracted
+            if rep_extracted is not None:
+                count += 1
+                if count > 1:
+                    break
+                extracted = rep_extracted
+
+        if count != 1:
             raise ValueError(
                 "Must have exactly one sequence represented as a extracted sequence in order to translate to a literal sequence."
             )
 
-        extracted = extracted_list[0]
-
-        start_pos = extracted.coordinateInterval.start
-        coordsystem = extracted.coordinateInterval.coordinateSystem.system.coding[
-            0
-        ].display
+        coordinate_interval = extracted.coordinateInterval
+        start_pos = coordinate_interval.start
+        coordsystem = coordinate_interval.coordinateSystem.system.coding[0].display
 
         start = apply_indexing(coord_system=coordsystem, start=start_pos)
-        end = extracted.coordinateInterval.end
+        end = coordinate_interval.end
 
         sequence_id = extracted.startingMolecule.display
         if sequence_id is None:
@@ -74,20 +128,32 @@ class RepresentationTranslator:
                 "The 'startingMolecule' must contain a 'display' for the sequence ID."
             )
 
+        return sequence_id, start, end
+
+    def _fill_from_span(self, sequence_id, span_start, span_end, ranges, literal_seqs):
+        """Fetch one merged span from SeqRepo and slice out the literal sequence of every range inside it.
+
+        Args:
+            sequence_id (str): The sequence to fetch from.
+            span_start (int): The start of the merged span.
+            span_end (int): The end of the merged span.
+            ranges (list[tuple]): The (start, end, index) ranges covered by the span.
+            literal_seqs (list): The output list, indexed by expression position.
+
+        Raises:
+            ValueError: If the sequence cannot be retrieved from SeqRepo.
+        """
         # capture the sequence using seqrepo
-        literal_seq = self.dp.get_sequence(sequence_id, start, end)
-        if literal_seq is None:
+        span_seq = self.dp.get_sequence(sequence_id, span_start, span_end)
+        if span_seq is None:
             raise ValueError(
-                f"Failed to retrieve sequence from seqrepo for ID {sequence_id} from position {start} to {end}."
+                f"Failed to retrieve sequence from seqrepo for ID {sequence_id} from position {span_start} to {span_end}."
             )
 
-        literal = MolecularDefinitionRepresentation(
-            literal=MolecularDefinitionRepresentationLiteral(value=literal_seq)
-        )
-
-        expression.representation.append(literal)
-        # expression.representation.insert(0, literal)
-        return expression
+        for start, end, index in ranges:
+            literal_seqs[index] = span_seq[
+                int(start - span_start) : int(end - span_start)
+            ]
 
     def translate_repeated_to_literal(self, expression):
         """Translates a repeated sequence motif representation into a literal sequence.
@@ -104,19 +170,23 @@ class RepresentationTranslator:
         """
         representations = self._validate_representation(expression)
 
-        repeated_listed = []
+        repeated = None
+        count = 0
         for rep in representations:
-            if hasattr(rep, "repeated") and rep.repeated is not None:
-                repeated_listed.append(rep.repeated)
-
-        if len(repeated_listed) != 1:
+            rep_repeated = rep.repeated
+            if rep_repeated is not None:
+                count += 1
+                if count > 1:
+                    break
+                repeated = rep_repeated
+
+        if count != 1:
             raise ValueError(
                 "Must have exactly one sequence represented as a repeated sequence motif in order to translate to a literal sequence."
             )
 
-        literal_seq = (
-            repeated_listed[0].sequenceMotif.display * repeated_listed[0].copyCount
-        )
+        motif = repeated.sequenceMotif.display
+        literal_seq = motif * repeated.copyCount
 
         literal = MolecularDefinitionRepresentation(
             literal=MolecularDefinitionRepresentationLiteral(value=literal_seq)
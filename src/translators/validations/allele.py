@@ -5,6 +5,10 @@ from exceptions.utils import (
     InvalidVRSAlleleError,
 )
 
+_VALID_STATE_TYPES = frozenset(
+    {"LiteralSequenceExpression", "ReferenceLengthExpression"}
+)
+
 
 def validate_vrs_allele(expression):
     """Validation step to ensure that the expression is a valid VRS Allele object.
@@ -16,22 +20,15 @@ def validate_vrs_allele(expression):
         InvalidVRSAlleleError: If the expression is not a valid VRS Allele object.
 
     """
-    valid_state_types = ["LiteralSequenceExpression", "ReferenceLengthExpression"]
-
-    conditions = [
-        (expression.type == "Allele", "The expression type must be 'Allele'."),
-        (
-            expression.location.type == "SequenceLocation",
-            "The location type must be 'SequenceLocation'.",
-        ),
-        (
-            expression.state.type in valid_state_types,
-            "The state type must be 'LiteralSequenceExpression' or 'ReferenceLengthExpression'.",
-        ),
-    ]
-    for condition, error_message in conditions:
-        if not condition:
-            raise InvalidVRSAlleleError(error_message)
+    # Checked in order so later attributes are only read once the earlier checks pass.
+    if expression.type != "Allele":
+        raise InvalidVRSAlleleError("The expression type must be 'Allele'.")
+    if expression.location.type != "SequenceLocation":
+        raise InvalidVRSAlleleError("The location type must be 'SequenceLocation'.")
+    if expression.state.type not in _VALID_STATE_TYPES:
+        raise InvalidVRSAlleleError(
+            "The state type must be 'LiteralSequenceExpression' or 'ReferenceLengthExpression'."
+        )
 
 
 def validate_allele_profile(expression: object):
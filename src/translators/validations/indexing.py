@@ -1,14 +1,60 @@
+from enum import IntEnum
+
 from exceptions.utils import (
     InvalidCoordinateSystemError,
 )
 
 
+class CoordinateSystem(IntEnum):
+    """Supported coordinate systems, in the order of their `_ADJUSTMENTS` entries."""
+
+    ZERO_BASED_INTERVAL = 0
+    ZERO_BASED_CHARACTER = 1
+    ONE_BASED_CHARACTER = 2
+
+
+_DISPLAY_TO_COORDINATE_SYSTEM = {
+    "0-based interval counting": CoordinateSystem.ZERO_BASED_INTERVAL,
+    "0-based character counting": CoordinateSystem.ZERO_BASED_CHARACTER,
+    "1-based character counting": CoordinateSystem.ONE_BASED_CHARACTER,
+}
+
+# Start adjustments indexed by CoordinateSystem, and keyed directly by display for string callers.
+_ADJUSTMENTS = (0, 1, -1)
+_DISPLAY_ADJUSTMENTS = {
+    display: _ADJUSTMENTS[coord_system]
+    for display, coord_system in _DISPLAY_TO_COORDINATE_SYSTEM.items()
+}
+
+_INVALID_COORDINATE_SYSTEM_MESSAGE = "Invalid coordinate system specified. Valid options are: '0-based interval counting', '0-based character counting', '1-based character counting'."
+
+
+def coordinate_system_from_display(display):
+    """Resolve a coordinate system display string to its CoordinateSystem.
+
+    Args:
+        display (str): The coordinate system display, which can be one of the following:
+                        '0-based interval counting', '0-based character counting', '1-based character counting'.
+
+    Raises:
+        ValueError: If an invalid coordinate system is specified.
+
+    Returns:
+        CoordinateSystem: The matching coordinate system.
+    """
+    try:
+        return _DISPLAY_TO_COORDINATE_SYSTEM[display]
+    except KeyError:
+        raise InvalidCoordinateSystemError(_INVALID_COORDINATE_SYSTEM_MESSAGE) from None
+
+
 def apply_indexing(coord_system, start):
     """Adjust the indexing based on the coordinate system.
 
     Args:
-        CoordSystem (str): The coordinate system, which can be one of the following:
-                            '0-based interval counting', '0-based character counting', '1-based character counting'.
+        CoordSystem (CoordinateSystem | str): The coordinate system, either already resolved or as one of the
+                            following displays: '0-based interval counting', '0-based character counting',
+                            '1-based character counting'.
         start (int): The start position to be adjusted.
 
     Raises:
@@ -18,15 +64,11 @@ def apply_indexing(coord_system, start):
         int: The adjusted start position.
 
     """
-    adjustments = {
-        "0-based interval counting": 0,
-        "0-based character counting": 1,
-        "1-based character counting": -1,
-    }
-
-    if coord_system not in adjustments:
-        raise InvalidCoordinateSystemError(
-            "Invalid coordinate system specified. Valid options are: '0-based interval counting', '0-based character counting', '1-based character counting'."
-        )
-
-    return start + adjustments[coord_system]
+    if isinstance(coord_system, CoordinateSystem):
+        return start + _ADJUSTMENTS[coord_system]
+
+    # Hot path for representation translation: a single dict probe on the display string.
+    try:
+        return start + _DISPLAY_ADJUSTMENTS[coord_system]
+    except KeyError:
+        raise InvalidCoordinateSystemError(_INVALID_COORDINATE_SYSTEM_MESSAGE) from None
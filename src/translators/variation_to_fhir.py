@@ -1,32 +1,67 @@
-from fhir.resources.codeableconcept import CodeableConcept
-from fhir.resources.coding import Coding
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from functools import cached_property, partial
+
 from fhir.resources.quantity import Quantity
 from fhir.resources.reference import Reference
-from ga4gh.vrs.dataproxy import create_dataproxy
 
 from conventions.coordinate_systems import (
+    coordinate_system,
     hgvs_coordinate_interval,
     spdi_coordinate_interval,
 )
+from conventions.fhir_codes import (
+    ALTERNATIVE_STATE_FOCUS,
+    MOLECULE_TYPE_SYSTEM,
+    REFERENCE_STATE_FOCUS,
+    focus_concept,
+    molecule_type_concept,
+)
 from conventions.refseq_identifiers import detect_sequence_type, refseq_to_fhir_id
 from profiles.variation import Variation
 from resources.moleculardefinition import (
     MolecularDefinitionLocation,
     MolecularDefinitionLocationSequenceLocation,
     MolecularDefinitionLocationSequenceLocationCoordinateInterval,
-    MolecularDefinitionLocationSequenceLocationCoordinateIntervalCoordinateSystem,
     MolecularDefinitionRepresentation,
     MolecularDefinitionRepresentationLiteral,
 )
+from vrs_tools.dataproxy import CachingDataProxy, coalesce_ranges, get_dataproxy
 from vrs_tools.hgvs_tools import HgvsToolsLite
 
 
+def _coordinate_system(fmt, sequence_type):
+    """Build the coordinate system for an input format and sequence type."""
+    if fmt == "hgvs":
+        interval = hgvs_coordinate_interval(molType=sequence_type)
+    elif fmt == "spdi":
+        interval = spdi_coordinate_interval()
+    else:
+        raise ValueError("Only 'hgvs' and 'spdi' formats are supported.")
+
+    return coordinate_system(interval)
+
+
+def _sequence_context(refseq_accession):
+    """Build the sequenceContext reference for a RefSeq accession."""
+    fhir_id = refseq_to_fhir_id(refseq_accession=refseq_accession)
+    return Reference.model_construct(
+        reference=f"#ref-to-{fhir_id}",
+        type="MolecularDefinition",
+        display=refseq_accession,
+    )
+
+
 class VariationToFhirTranslator:
     """Translating a SPDI or HGVS expression into a FHIR Variation Profile object."""
     def __init__(self, dp=None, uri: str | None = None):
-        self.dp = dp or create_dataproxy(uri=uri)
+        self.dp = CachingDataProxy(dp or get_dataproxy(uri=uri))
+
+    @cached_property
+    def hgvs_tools(self):
+        """The HGVS parser, built on first use so SPDI-only callers never load its grammar."""
         # most likely need to replace this
-        self.hgvs_tools = HgvsToolsLite(data_proxy=self.dp)
+        return HgvsToolsLite(data_proxy=self.dp)
 
     def _hgvs_position(self, sv):
         """Extract the start and end base positions from an HGVS sequence variant."""
@@ -47,41 +82,75 @@ class VariationToFhirTranslator:
         Returns:
             object: A FHIR Variation Profile object representing the parsed SPDI variant.
         """
+        seq_acc, start, end, ref_seq, alt_seq = self._parse_spdi(spdi)
+
+        if ref_seq is None:
+            ref_seq = self.dp.get_sequence(self._refseq_alias(seq_acc), start, end)
+
+        values = {
+            "refget_accession": seq_acc,
+            "start": start,
+            "end": end,
+            "ref_seq": ref_seq,
+            "alt_seq": alt_seq,
+        }
+
+        return self._create_variation_profile(values, fmt="spdi")
+
+    def _refseq_alias(self, seq_acc):
+        """Return the first RefSeq alias SeqRepo knows for a sequence accession.
+
+        Args:
+            seq_acc (str): The sequence accession from an SPDI expression.
+
+        Raises:
+            ValueError: If SeqRepo has no RefSeq alias for the accession.
+
+        Returns:
+            str: The RefSeq identifier without its namespace prefix.
+        """
+        aliases = self.dp.translate_sequence_identifier(seq_acc, "refseq")
+        if not aliases:
+            raise ValueError(
+                f"No RefSeq alias found for sequence accession '{seq_acc}'."
+            )
+        return aliases[0].split(":", 1)[1]
+
+    def _parse_spdi(self, spdi):
+        """Parse an SPDI string into its accession, 0-based interbase range, deleted and inserted sequences.
+
+        Args:
+            spdi (str): A valid spdi string. "<sequence_accession>:<position>:<deleted_sequence_or_length>:<inserted_sequence>".
+
+        Raises:
+            TypeError: If the provided `spdi` argument is not a string.
+            ValueError:  If the SPDI string does not contain four colon-separated fields or
+            cannot be parsed correctly.
+
+        Returns:
+            tuple: (seq_acc, start, end, ref_seq, alt_seq), where ref_seq is None when the deletion is given only as
+            a non-zero length and must be fetched from SeqRepo.
+        """
         if not isinstance(spdi, str):
             raise TypeError("SPDI expression must be a string.")
 
-        try:
-            seq_acc, pos, del_seq_or_len, ins_seq = spdi.split(":", maxsplit=3)
-        except:
+        parts = spdi.split(":", maxsplit=3)
+        if len(parts) != 4:
             raise ValueError(
                 f"Invalid SPDI expected four colon-separated fields: {spdi}"
             )
-
-        seq_acc = str(seq_acc).strip()
+        seq_acc, pos, del_seq_or_len, alt_seq = parts
 
         start = int(pos)
-
+        # The deletion is either a length or the deleted bases themselves, which per SPDI are the reference allele.
         try:
             del_len = int(del_seq_or_len)
+            ref_seq = None if del_len else ""
         except ValueError:
             del_len = len(del_seq_or_len)
-        end = start + del_len
+            ref_seq = del_seq_or_len
 
-        alt_seq = str(ins_seq)
-
-        aliases = self.dp.translate_sequence_identifier(seq_acc, "refseq")
-        aliases = [a.split(":")[1] for a in aliases]
-        ref_seq = self.dp.get_sequence(aliases[0], start, end)
-
-        values = {
-            "refget_accession": seq_acc,
-            "start": start,
-            "end": end,
-            "ref_seq": ref_seq,
-            "alt_seq": alt_seq,
-        }
-
-        return self._create_variation_profile(values, fmt="spdi")
+        return seq_acc.strip(), start, start + del_len, ref_seq, alt_seq
 
     def _from_hgvs(self, hgvs_expr):
         """Create a variation profile from an HGVS expression.
@@ -114,7 +183,10 @@ class VariationToFhirTranslator:
         elif edit_type == "sub":
             ref_seq = sv.posedit.edit.ref
         elif edit_type == "identity":
-            ref_seq = self.dp.get_sequence(sv.ac, start_pos, end_pos)
+            # An identity written with its bases (e.g., "123A=") already states the reference allele.
+            ref_seq = sv.posedit.edit.ref or self.dp.get_sequence(
+                sv.ac, start_pos, end_pos
+            )
             if not ref_seq:
                 ref_seq = sv.posedit.edit.alt or ""
         else:
@@ -141,47 +213,16 @@ class VariationToFhirTranslator:
         Returns:
             object: A fully populated FHIR Variation object.
         """
-        MOLTYPE_SYSTEM_DEFAULT_VALUE = "http://hl7.org/fhir/uv/molecular-definition-data-types/CodeSystem/molecule-type"
-        FOCUS_SYSTEM_DEFAULT_VALUE = "http://hl7.org/fhir/uv/molecular-definition-data-types/CodeSystem/molecular-definition-focus"
-
         sequence_type = detect_sequence_type(values["refget_accession"])
 
-        mol_type = CodeableConcept(
-            coding=[
-                Coding(
-                    system=MOLTYPE_SYSTEM_DEFAULT_VALUE,
-                    code=sequence_type.lower(),
-                    display=f"{sequence_type} Sequence",
-                )
-            ]
-        )
-
-        if fmt == "hgvs":
-            coord_system_values, coord_system_origin, normalization_method = (
-                hgvs_coordinate_interval(molType=sequence_type)
-            )
-        elif fmt == "spdi":
-            coord_system_values, coord_system_origin, normalization_method = (
-                spdi_coordinate_interval()
-            )
+        mol_type = molecule_type_concept(MOLECULE_TYPE_SYSTEM, sequence_type)
 
-        fhir_id = refseq_to_fhir_id(refseq_accession=values["refget_accession"])
-
-        sequence_context = Reference(
-            reference=f"#ref-to-{fhir_id}",
-            type="MolecularDefinition",
-            display=values["refget_accession"],
-        )
-
-        coord_system = MolecularDefinitionLocationSequenceLocationCoordinateIntervalCoordinateSystem(
-            system=coord_system_values,
-            origin=coord_system_origin,
-            normalizationMethod=normalization_method,
-        )
+        coord_system = _coordinate_system(fmt, sequence_type)
+        sequence_context = _sequence_context(values["refget_accession"])
 
         start, end = (
-            Quantity(value=int(values["start"])),
-            Quantity(value=int(values["end"])),
+            Quantity.model_construct(value=Decimal(int(values["start"]))),
+            Quantity.model_construct(value=Decimal(int(values["end"]))),
         )
 
         coord_interval = MolecularDefinitionLocationSequenceLocationCoordinateInterval(
@@ -196,36 +237,20 @@ class VariationToFhirTranslator:
         location = MolecularDefinitionLocation(sequenceLocation=seq_loc)
 
         ############################ Rep trans ########################
-        ref_state_lit_value = MolecularDefinitionRepresentationLiteral(
+        ref_state_lit_value = MolecularDefinitionRepresentationLiteral.model_construct(
             value=values["ref_seq"]
         )
         ref_state_rep = MolecularDefinitionRepresentation(
-            focus=CodeableConcept(
-                coding=[
-                    Coding(
-                        system=FOCUS_SYSTEM_DEFAULT_VALUE,
-                        code="reference-state",
-                        display="Reference State",
-                    )
-                ]
-            ),
+            focus=focus_concept(REFERENCE_STATE_FOCUS),
             literal=ref_state_lit_value,
         )
 
-        alt_state_lit_value = MolecularDefinitionRepresentationLiteral(
+        alt_state_lit_value = MolecularDefinitionRepresentationLiteral.model_construct(
             value=values["alt_seq"]
         )
 
         alt_state_rep = MolecularDefinitionRepresentation(
-            focus=CodeableConcept(
-                coding=[
-                    Coding(
-                        system=FOCUS_SYSTEM_DEFAULT_VALUE,
-                        code="alternative-state",
-                        display="Alternative State",
-                    )
-                ]
-            ),
+            focus=focus_concept(ALTERNATIVE_STATE_FOCUS),
             literal=alt_state_lit_value,
         )
         ############################ Rep trans ########################
@@ -238,6 +263,90 @@ class VariationToFhirTranslator:
             representation=[ref_state_rep, alt_state_rep],
         )
 
+    def translate_many(self, variants, fmt):
+        """Translate many variants (HGVS or SPDI) into FHIR Variation objects.
+
+        For SPDI input every expression is parsed first. Reference alleles that are only given as a length are then
+        resolved per accession: each accession is translated to RefSeq once, and overlapping or adjacent ranges on it
+        are fetched from SeqRepo as a single span.
+
+        Args:
+            variants (Iterable[str]): Variant expressions in HGVS or SPDI format.
+            fmt (str): The input format of the variants. Must be either "hgvs" or "spdi".
+
+        Raises:
+            ValueError: If an unsupported format is provided (i.e., not "hgvs" or "spdi").
+            ValueError: If a reference sequence cannot be retrieved from SeqRepo.
+
+        Returns:
+            list: FHIR Variation objects, in input order.
+        """
+        if fmt == "hgvs":
+            return [self._from_hgvs(var) for var in variants]
+        if fmt != "spdi":
+            raise ValueError("Only 'hgvs' and 'spdi' formats are supported.")
+
+        parsed = [self._parse_spdi(var) for var in variants]
+
+        ref_seqs = [ref_seq for _, _, _, ref_seq, _ in parsed]
+
+        ranges_by_accession = {}
+        for index, (seq_acc, start, end, ref_seq, _) in enumerate(parsed):
+            if ref_seq is None:
+                ranges_by_accession.setdefault(seq_acc, []).append((start, end, index))
+
+        for seq_acc, ranges in ranges_by_accession.items():
+            refseq_id = self._refseq_alias(seq_acc)
+            for span_start, span_end, members in coalesce_ranges(ranges):
+                span_seq = self.dp.get_sequence(refseq_id, span_start, span_end)
+                if span_seq is None:
+                    raise ValueError(
+                        f"Failed to retrieve sequence from seqrepo for ID {refseq_id} from position {span_start} to {span_end}."
+                    )
+                for start, end, index in members:
+                    ref_seqs[index] = span_seq[start - span_start : end - span_start]
+
+        return [
+            self._create_variation_profile(
+                {
+                    "refget_accession": seq_acc,
+                    "start": start,
+                    "end": end,
+                    "ref_seq": ref_seq,
+                    "alt_seq": alt_seq,
+                },
+                fmt="spdi",
+            )
+            for (seq_acc, start, end, _, alt_seq), ref_seq in zip(parsed, ref_seqs)
+        ]
+
+    def translate_many_concurrent(self, variants, fmt, max_workers=8):
+        """Translate many variants (HGVS or SPDI) on a thread pool, one variant per task.
+
+        Translation time is dominated by SeqRepo lookups, which release the GIL while they wait on I/O, so this mainly
+        pays off against network-backed data proxies. Results share this translator's lookup caches.
+
+        Args:
+            variants (Iterable[str]): Variant expressions in HGVS or SPDI format.
+            fmt (str): The input format of the variants. Must be either "hgvs" or "spdi".
+            max_workers (int, optional): The maximum number of worker threads. Defaults to 8.
+
+        Raises:
+            ValueError: If an unsupported format is provided (i.e., not "hgvs" or "spdi").
+
+        Returns:
+            list: FHIR Variation objects, in input order.
+        """
+        if fmt not in ("hgvs", "spdi"):
+            raise ValueError("Only 'hgvs' and 'spdi' formats are supported.")
+
+        if fmt == "hgvs":
+            # Build the parser before fanning out so workers don't each race to create one.
+            _ = self.hgvs_tools
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(partial(self.translate, fmt=fmt), variants))
+
     def translate(self, var, fmt):
         """Translate a variant (HGVS or SPDI) into a FHIR Variation object.
 
@@ -257,3 +366,30 @@ class VariationToFhirTranslator:
             return self._from_spdi(var)
         else:
             raise ValueError("Only 'hgvs' and 'spdi' formats are supported.")
+
+    def translate_json(self, var, fmt):
+        """Translate a variant (HGVS or SPDI) straight to FHIR Variation JSON.
+
+        Args:
+            var (str): A variant expression in HGVS or SPDI format.
+            fmt (str): The input format of the variant. Must be either "hgvs" or "spdi".
+
+        Returns:
+            str: The FHIR Variation serialized as JSON, without null fields.
+        """
+        return self.translate(var, fmt).model_dump_json(exclude_none=True)
+
+    def translate_many_json(self, variants, fmt):
+        """Translate many variants (HGVS or SPDI) into newline-delimited FHIR Variation JSON for bulk export.
+
+        Args:
+            variants (Iterable[str]): Variant expressions in HGVS or SPDI format.
+            fmt (str): The input format of the variants. Must be either "hgvs" or "spdi".
+
+        Returns:
+            bytes: One JSON-serialized FHIR Variation per line, in input order.
+        """
+        return b"".join(
+            variation.model_dump_json(exclude_none=True).encode() + b"\n"
+            for variation in self.translate_many(variants, fmt)
+        )
@@ -1,12 +1,18 @@
+from decimal import Decimal
+
 from fhir.resources.codeableconcept import CodeableConcept
 from fhir.resources.coding import Coding
 from fhir.resources.extension import Extension
 from fhir.resources.identifier import Identifier
 from fhir.resources.quantity import Quantity
 from fhir.resources.reference import Reference
-from ga4gh.vrs.dataproxy import create_dataproxy
 
-from conventions.coordinate_systems import vrs_coordinate_interval
+from conventions.coordinate_systems import vrs_coordinate_system
+from conventions.fhir_codes import (
+    ALLELE_STATE_FOCUS,
+    focus_concept,
+    molecule_type_concept,
+)
 from conventions.refseq_identifiers import (
     detect_sequence_type,
     translate_sequence_id,
@@ -17,7 +23,6 @@ from resources.moleculardefinition import (
     MolecularDefinitionLocation,
     MolecularDefinitionLocationSequenceLocation,
     MolecularDefinitionLocationSequenceLocationCoordinateInterval,
-    MolecularDefinitionLocationSequenceLocationCoordinateIntervalCoordinateSystem,
     MolecularDefinitionRepresentation,
     MolecularDefinitionRepresentationLiteral,
 )
@@ -35,13 +40,21 @@ from translators.constants.vrs_json_pointers import (
 from translators.validations.allele import (
     validate_vrs_allele,
 )
+from vrs_tools.dataproxy import CachingDataProxy, get_dataproxy
 from vrs_tools.normalizer import VariantNormalizer
 
+_MAPPED_MOL_TYPE = {
+    "genomic": "dna",
+    "RNA": "rna",
+    "mRNA": "rna",
+    "protein": "amino acid",
+}
+
 
 class VrsToFhirAlleleTranslator:
     """Translate GA4GH VRS Allele objects into the FHIR Allele Profile,providing full translation."""
     def __init__(self, dp=None, uri: str | None = None):
-        self.dp = dp or create_dataproxy(uri=uri)
+        self.dp = CachingDataProxy(dp or get_dataproxy(uri=uri))
         self.allele_denormalize = VariantNormalizer(dp=self.dp)
 
     def translate(self, vrs_allele):
@@ -98,13 +111,6 @@ class VrsToFhirAlleleTranslator:
             CodeableConcept: A FHIR-compliant CodeableConcept indicating the sequence type (e.g., DNA, RNA, or AA) based on the detected molecular type.
 
         """
-        mapped_mol_type = {
-            "genomic": "dna",
-            "RNA": "rna",
-            "mRNA": "rna",
-            "protein": "amino acid",
-        }
-
         molecule_type = getattr(ao.location.sequenceReference, "moleculeType", None)
 
         if not molecule_type:
@@ -113,16 +119,8 @@ class VrsToFhirAlleleTranslator:
         else:
             sequence_type = molecule_type
 
-        molecule_type = mapped_mol_type.get(sequence_type)
-
-        return CodeableConcept(
-            coding=[
-                Coding(
-                    system=SEQ_REF_PTRS["moleculeType"],
-                    code=molecule_type.lower(),
-                    display=f"{molecule_type} Sequence",
-                )
-            ]
+        return molecule_type_concept(
+            SEQ_REF_PTRS["moleculeType"], _MAPPED_MOL_TYPE.get(sequence_type)
         )
 
     # ========== Identifiers Mapping ==========
@@ -374,19 +372,9 @@ class VrsToFhirAlleleTranslator:
             Object: A FHIR representation of the allele with focus, code, and literal fields populated.
 
         """
-        # NOTE: this is hard coded because its required in the FHIR Allele Schema.
-        focus_value = CodeableConcept(
-            coding=[
-                Coding(
-                    system="http://hl7.org/fhir/moleculardefinition-focus",
-                    code="allele-state",
-                    display="Allele State",
-                )
-            ]
-        )
-
         rep = MolecularDefinitionRepresentation(
-            focus=focus_value,
+            # NOTE: this is hard coded because its required in the FHIR Allele Schema.
+            focus=focus_concept(ALLELE_STATE_FOCUS),
             code=self._map_codeable_concept(ao),
             literal=self._map_literal_representation(ao),
         )
@@ -472,14 +460,11 @@ class VrsToFhirAlleleTranslator:
         """Maps a VRS allele's start and end coordinates to a FHIR CoordinateInterval using 0-based interbase indexing.
         """
         start, end = (
-            Quantity(value=int(ao.location.start)),
-            Quantity(value=int(ao.location.end)),
+            Quantity.model_construct(value=Decimal(int(ao.location.start))),
+            Quantity.model_construct(value=Decimal(int(ao.location.end))),
         )
 
-        system, origin, norm_method = vrs_coordinate_interval()
-        coord_system_fhir = MolecularDefinitionLocationSequenceLocationCoordinateIntervalCoordinateSystem(
-            system=system, origin=origin, normalizationMethod=norm_method
-        )
+        coord_system_fhir = vrs_coordinate_system()
 
         return MolecularDefinitionLocationSequenceLocationCoordinateInterval(
             coordinateSystem=coord_system_fhir,
@@ -634,7 +619,7 @@ class VrsToFhirAlleleTranslator:
 
     def _reference_location_sequence(self):
         """Create reference objects for location.sequence."""
-        return Reference(
+        return Reference.model_construct(
             type="Sequence",
             reference="#vrs-location-sequence",
             display="VRS location.sequence as contained FHIR Sequence.",
@@ -642,7 +627,7 @@ class VrsToFhirAlleleTranslator:
 
     def _reference_sequence_reference(self):
         """Create reference objects for location.sequenceReference."""
-        return Reference(
+        return Reference.model_construct(
             type="Sequence",
             reference="#vrs-location-sequenceReference",
             display="VRS location.sequenceReference as contained FHIR Sequence",
@@ -0,0 +1,162 @@
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Final
+
+from ga4gh.vrs.dataproxy import create_dataproxy
+
+from exceptions.api import SeqRepoDataProxyCreationError
+
+_DATAPROXY_URI_ENV: Final = "GA4GH_VRS_DATAPROXY_URI"
+_SEQREPO_FILE_SCHEME: Final = "seqrepo+file://"
+
+
+@lru_cache(maxsize=4)
+def get_dataproxy(uri: str | None = None):
+    """Return the process-wide SeqRepo data proxy for a URI, creating it on first use.
+
+    Args:
+        uri (str, optional): The data proxy URI (e.g., 'seqrepo+file:///usr/local/share/seqrepo/2024-12-20').
+            Defaults to None, which lets ga4gh resolve the `GA4GH_VRS_DATAPROXY_URI` environment variable.
+
+    Raises:
+        SeqRepoDataProxyCreationError: If a local SeqRepo URI points to a directory that does not exist.
+
+    Returns:
+        _DataProxy: A shared data proxy instance.
+    """
+    resolved_uri = uri or os.environ.get(_DATAPROXY_URI_ENV, "")
+    if resolved_uri.startswith(_SEQREPO_FILE_SCHEME):
+        # Fail fast rather than letting SeqRepo do filesystem work on a path that cannot succeed.
+        path = resolved_uri[len(_SEQREPO_FILE_SCHEME) :]
+        if not os.path.isdir(path):
+            raise SeqRepoDataProxyCreationError(
+                f"Local SeqRepo directory does not exist: {path}"
+            )
+    return create_dataproxy(uri=uri)
+
+
+class CachingDataProxy:
+    """Wrap a data proxy with small LRU caches for repeated SeqRepo lookups.
+
+    Batch translations tend to hit the same accessions over and over, so identifier translations, refget accession
+    derivations and sequence fetches are memoized here. SeqRepo content is immutable, so cached results never go stale. Any other attribute is delegated to the wrapped proxy unchanged.
+
+    Cache bookkeeping is guarded by a lock so one instance can be shared by worker threads; lookups against the wrapped
+    proxy run outside the lock, so concurrent misses for the same key may each reach SeqRepo once.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, inner, id_cache_size: int = 4096, seq_cache_size: int = 256):
+        self._inner = inner
+        self._id_cache_size = id_cache_size
+        self._seq_cache_size = seq_cache_size
+        self._id_cache = OrderedDict()
+        self._refget_cache = OrderedDict()
+        self._seq_cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        return getattr(self._inner, name)
+
+    def clear_cache(self):
+        """Drop every cached identifier translation, refget accession and sequence."""
+        with self._lock:
+            self._id_cache.clear()
+            self._refget_cache.clear()
+            self._seq_cache.clear()
+
+    def _cached(self, cache, key):
+        """Return the cached value for a key and mark it recently used, or `_MISSING`."""
+        with self._lock:
+            value = cache.get(key, self._MISSING)
+            if value is not self._MISSING:
+                cache.move_to_end(key)
+            return value
+
+    def _store(self, cache, key, value, max_size):
+        """Cache a value, evicting the least recently used entry once the cache is full."""
+        with self._lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            if len(cache) > max_size:
+                cache.popitem(last=False)
+
+    def translate_sequence_identifier(self, identifier, namespace=None):
+        """Translate a sequence identifier into the given namespace, reusing earlier results.
+
+        Args:
+            identifier (str): The sequence identifier to translate (e.g., 'ga4gh:SQ.abc').
+            namespace (str, optional): The target namespace (e.g., 'refseq'). Defaults to None.
+
+        Returns:
+            list[str]: The translated identifiers, as returned by the wrapped proxy.
+        """
+        key = (identifier, namespace)
+        cached = self._cached(self._id_cache, key)
+        if cached is not self._MISSING:
+            return list(cached)
+
+        result = self._inner.translate_sequence_identifier(identifier, namespace)
+        self._store(self._id_cache, key, tuple(result), self._id_cache_size)
+        return result
+
+    def derive_refget_accession(self, ac):
+        """Derive the refget accession for a sequence accession, reusing earlier results.
+
+        Args:
+            ac (str): The sequence accession (e.g., 'refseq:NM_000551.3').
+
+        Returns:
+            str | None: The refget accession (e.g., 'refget:SQ.abc'), as returned by the wrapped proxy.
+        """
+        cached = self._cached(self._refget_cache, ac)
+        if cached is not self._MISSING:
+            return cached
+
+        result = self._inner.derive_refget_accession(ac)
+        self._store(self._refget_cache, ac, result, self._id_cache_size)
+        return result
+
+    def get_sequence(self, identifier, start=None, end=None):
+        """Fetch a sequence or subsequence, reusing earlier results for the same range.
+
+        Args:
+            identifier (str): The sequence identifier.
+            start (int, optional): The 0-based interbase start. Defaults to None.
+            end (int, optional): The 0-based interbase end. Defaults to None.
+
+        Returns:
+            str: The requested sequence.
+        """
+        key = (identifier, start, end)
+        cached = self._cached(self._seq_cache, key)
+        if cached is not self._MISSING:
+            return cached
+
+        result = self._inner.get_sequence(identifier, start, end)
+        self._store(self._seq_cache, key, result, self._seq_cache_size)
+        return result
+
+
+def coalesce_ranges(ranges):
+    """Merge overlapping or adjacent ranges on one sequence into spans that can each be fetched once.
+
+    Args:
+        ranges (Iterable[tuple]): (start, end, key) ranges, where key identifies the request the range belongs to.
+
+    Returns:
+        list[tuple]: (span_start, span_end, members) spans in ascending order, where members are the input ranges
+        covered by the span.
+    """
+    spans = []
+    for start, end, key in sorted(ranges, key=lambda r: (r[0], r[1])):
+        if spans and start <= spans[-1][1]:
+            span = spans[-1]
+            span[1] = max(span[1], end)
+            span[2].append((start, end, key))
+        else:
+            spans.append([start, end, [(start, end, key)]])
+    return [tuple(span) for span in spans]
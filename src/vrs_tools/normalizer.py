@@ -1,4 +1,3 @@
-from ga4gh.vrs.dataproxy import create_dataproxy
 from ga4gh.core import ga4gh_identify
 from ga4gh.vrs.models import LiteralSequenceExpression
 from ga4gh.vrs.normalize import (
@@ -6,12 +5,14 @@ from ga4gh.vrs.normalize import (
     normalize as vrs_normalize,
 )
 
+from vrs_tools.dataproxy import get_dataproxy
+
 
 class VariantNormalizer:
     """Handles variant normalization using GA4GH VRS."""
 
     def __init__(self, dp=None, uri: str | None = None):
-        self.dp = dp or create_dataproxy(uri=uri)
+        self.dp = dp or get_dataproxy(uri=uri)
 
     def normalize(self, allele):
         """Normalize an allele and assign GA4GH digest-based identifiers."""
@@ -26,16 +27,17 @@ class VariantNormalizer:
 
     def denormalize_reference_length(self, ao):
         """Denormalize a ReferenceLengthExpression allele expression into a literal sequence."""
-        sequence = f"ga4gh:{ao.location.get_refget_accession()}"
+        # Only ReferenceLengthExpressions need the reference sequence, so skip the SeqRepo lookups otherwise.
+        if ao.state.type == "ReferenceLengthExpression":
+            sequence = f"ga4gh:{ao.location.get_refget_accession()}"
 
-        aliases = self.dp.translate_sequence_identifier(sequence, "refseq")
-        refseq_id = aliases[0].split(":")[1]
+            aliases = self.dp.translate_sequence_identifier(sequence, "refseq")
+            refseq_id = aliases[0].split(":")[1]
 
-        ref_seq = self.dp.get_sequence(
-            identifier=refseq_id, start=ao.location.start, end=ao.location.end
-        )
+            ref_seq = self.dp.get_sequence(
+                identifier=refseq_id, start=ao.location.start, end=ao.location.end
+            )
 
-        if ao.state.type == "ReferenceLengthExpression":
             alt_seq = denormalize_reference_length_expression(
                 ref_seq=ref_seq,
                 repeat_subunit_length=ao.state.repeatSubunitLength,
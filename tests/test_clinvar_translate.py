@@ -0,0 +1,139 @@
+import copy
+import gzip
+
+import orjson
+import pytest
+from ga4gh.vrs.models import Allele as VrsAllele
+
+from pipelines import clinvar_translate
+from pipelines.clinvar_translate import ClinvarTranslationPipeline, _translate_batch
+from tests.examples.allele_test_data import vrs_synthetic_data
+from translators.vrs_to_fhir_allele import VrsToFhirAlleleTranslator
+
+
+@pytest.fixture
+def expected_translation():
+    vo = VrsAllele(**vrs_synthetic_data)
+    fhir_obj = VrsToFhirAlleleTranslator().translate(vo)
+    return {
+        "vrs_allele": vo.model_dump(mode="json", exclude_none=True),
+        "fhir_allele": fhir_obj.model_dump(mode="json", exclude_none=True),
+    }
+
+
+@pytest.fixture
+def invalid_member():
+    member = copy.deepcopy(vrs_synthetic_data)
+    del member["state"]
+    return member
+
+
+def _line(*members):
+    return orjson.dumps({"members": list(members)})
+
+
+def test_translate_batch_valid_lse(expected_translation):
+    translated, invalid_alleles, invalid_translations, stats = _translate_batch(
+        [(1, _line(vrs_synthetic_data))]
+    )
+
+    assert [orjson.loads(record) for record in translated] == [
+        {"line": 1, **expected_translation}
+    ]
+    assert invalid_alleles == []
+    assert invalid_translations == []
+    assert stats["vrs_allele_seen"] == 1
+    assert stats["lse_count"] == 1
+    assert stats["total_translated"] == 1
+
+
+def test_translate_batch_invalid_vrs_member(invalid_member):
+    translated, invalid_alleles, invalid_translations, stats = _translate_batch(
+        [(7, _line(invalid_member))]
+    )
+
+    assert translated == []
+    assert invalid_translations == []
+    record = orjson.loads(invalid_alleles[0])
+    assert record["line"] == 7
+    assert record["member"] == invalid_member
+    assert stats["vrs_allele_seen"] == 1
+    assert stats["failed_vrs_allele_validation"] == 1
+    assert stats["total_translated"] == 0
+
+
+def test_translate_batch_malformed_json_line():
+    translated, invalid_alleles, invalid_translations, stats = _translate_batch(
+        [(3, b'{"members": [')]
+    )
+
+    assert translated == invalid_alleles == invalid_translations == []
+    assert stats["total_lines_read"] == 1
+    assert stats["vrs_allele_seen"] == 0
+
+
+def test_run_single_worker(tmp_path, monkeypatch, expected_translation, invalid_member):
+    # run() writes runtime_stats.txt to the working directory.
+    monkeypatch.chdir(tmp_path)
+    inputfile = tmp_path / "clinvar.jsonl.gz"
+    with gzip.open(inputfile, "wb") as f:
+        f.write(_line(vrs_synthetic_data) + b"\n")
+        f.write(b'{"members": [\n')
+        f.write(_line(invalid_member) + b"\n")
+
+    outputfile = tmp_path / "translations.jsonl"
+    invalid_allele_path = tmp_path / "invalid_alleles.jsonl"
+    invalid_fhir_path = tmp_path / "invalid_fhir.jsonl"
+    ClinvarTranslationPipeline().run(
+        inputfile=inputfile,
+        outputfile=outputfile,
+        invalid_allele_path=invalid_allele_path,
+        invalid_fhir_path=invalid_fhir_path,
+        workers=1,
+    )
+
+    output = [orjson.loads(line) for line in outputfile.read_bytes().splitlines()]
+    assert output == [{"line": 1, **expected_translation}]
+
+    invalid_alleles = invalid_allele_path.read_bytes().splitlines()
+    assert [orjson.loads(line)["line"] for line in invalid_alleles] == [3]
+    assert invalid_fhir_path.read_bytes() == b""
+
+    stats = orjson.loads((tmp_path / "runtime_stats.txt").read_bytes())
+    assert stats["total_lines_read"] == 3
+    assert stats["vrs_allele_seen"] == 2
+    assert stats["total_translated"] == 1
+    assert stats["failed_vrs_allele_validation"] == 1
+
+
+def test_run_multiple_workers_keeps_input_order(
+    tmp_path, monkeypatch, expected_translation, invalid_member
+):
+    monkeypatch.chdir(tmp_path)
+    # Small batches spread the input over several worker tasks.
+    monkeypatch.setattr(clinvar_translate, "_BATCH_SIZE", 2)
+    invalid_lines = {3, 6, 10}
+    inputfile = tmp_path / "clinvar.jsonl.gz"
+    with gzip.open(inputfile, "wb") as f:
+        for line_num in range(1, 12):
+            member = invalid_member if line_num in invalid_lines else vrs_synthetic_data
+            f.write(_line(member) + b"\n")
+
+    outputfile = tmp_path / "translations.jsonl"
+    invalid_allele_path = tmp_path / "invalid_alleles.jsonl"
+    ClinvarTranslationPipeline().run(
+        inputfile=inputfile,
+        outputfile=outputfile,
+        invalid_allele_path=invalid_allele_path,
+        invalid_fhir_path=tmp_path / "invalid_fhir.jsonl",
+        workers=2,
+    )
+
+    output = [orjson.loads(line) for line in outputfile.read_bytes().splitlines()]
+    assert output == [
+        {"line": line_num, **expected_translation}
+        for line_num in range(1, 12)
+        if line_num not in invalid_lines
+    ]
+    invalid_alleles = invalid_allele_path.read_bytes().splitlines()
+    assert [orjson.loads(line)["line"] for line in invalid_alleles] == [3, 6, 10]
@@ -0,0 +1,30 @@
+import pytest
+
+from vrs_tools.dataproxy import coalesce_ranges
+
+
+@pytest.mark.parametrize(
+    "ranges, expected",
+    [
+        (
+            [(10, 15, "b"), (0, 12, "a")],
+            [(0, 15, [(0, 12, "a"), (10, 15, "b")])],
+        ),
+        (
+            [(0, 5, "a"), (5, 9, "b")],
+            [(0, 9, [(0, 5, "a"), (5, 9, "b")])],
+        ),
+        (
+            [(0, 20, "a"), (5, 8, "b"), (18, 25, "c")],
+            [(0, 25, [(0, 20, "a"), (5, 8, "b"), (18, 25, "c")])],
+        ),
+        (
+            [(10, 12, "b"), (0, 5, "a")],
+            [(0, 5, [(0, 5, "a")]), (10, 12, [(10, 12, "b")])],
+        ),
+        ([], []),
+    ],
+    ids=["overlapping", "adjacent", "nested", "disjoint", "empty"],
+)
+def test_coalesce_ranges(ranges, expected):
+    assert coalesce_ranges(ranges) == expected
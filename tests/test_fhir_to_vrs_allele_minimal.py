@@ -142,3 +142,17 @@ def test_translate_allele_profile(
     ).model_dump(exclude_none=True)
 
     assert output_dict == vrs_expected_outputs[normalize]
+
+
+@pytest.mark.parametrize("trust_input", [True, False])
+@pytest.mark.parametrize("normalize", [True, False])
+def test_translate_many_allele_profiles(
+    allele_translator, allele_profile, vrs_expected_outputs, normalize, trust_input
+):
+    outputs = allele_translator.translate_many(
+        [allele_profile, allele_profile], normalize=normalize, trust_input=trust_input
+    )
+
+    assert [output.model_dump(exclude_none=True) for output in outputs] == [
+        vrs_expected_outputs[normalize]
+    ] * 2
@@ -744,3 +744,94 @@ def test_from_spdi(variation_translator):
         variation_translator.translate(dup_input["spdi"], fmt="spdi").model_dump()
         == dup_expected_spdi
     )
+
+
+def test_translate_many_spdi(variation_translator):
+    spdi_inputs = [
+        sub_input["spdi"],
+        *del_input["spdi"],
+        *ins_input["spdi"],
+        dup_input["spdi"],
+    ]
+    results = [
+        result.model_dump()
+        for result in variation_translator.translate_many(spdi_inputs, fmt="spdi")
+    ]
+    assert results == [
+        sub_expected_spdi,
+        del_expected_spdi,
+        del_expected_spdi,
+        ins_expected_spdi,
+        ins_expected_spdi,
+        dup_expected_spdi,
+    ]
+
+
+def test_translate_many_concurrent_hgvs(variation_translator):
+    hgvs_inputs = [
+        sub_input["hgvs"],
+        del_input["hgvs"],
+        ins_input["hgvs"],
+        dup_input["hgvs"],
+    ]
+    results = [
+        result.model_dump()
+        for result in variation_translator.translate_many_concurrent(
+            hgvs_inputs, fmt="hgvs", max_workers=4
+        )
+    ]
+    assert results == [
+        sub_expected_hgvs,
+        del_expected_hgvs,
+        ins_expected_hgvs,
+        dup_expected_hgvs,
+    ]
+
+
+def test_editing_a_result_does_not_change_later_translations(variation_translator):
+    first = variation_translator.translate(sub_input["spdi"], fmt="spdi")
+    sequence_location = first.location[0].sequenceLocation
+    sequence_location.sequenceContext.display = "edited"
+    coordinate_system = sequence_location.coordinateInterval.coordinateSystem
+    coordinate_system.system.coding[0].display = "edited"
+    first.moleculeType.coding[0].display = "edited"
+    first.representation[0].focus.coding[0].display = "edited"
+
+    second = variation_translator.translate(sub_input["spdi"], fmt="spdi")
+    assert second.model_dump() == sub_expected_spdi
+
+
+def test_translate_many_spdi_fetches_merged_span_once(
+    variation_translator, monkeypatch
+):
+    # Overlapping and adjacent length-form deletions on one accession.
+    spdi_inputs = [
+        "NC_000019.10:44908820:3:A",
+        sub_input["spdi"],
+        "NC_000019.10:44908822:1:G",
+    ]
+    expected = [
+        variation_translator.translate(spdi, fmt="spdi").model_dump()
+        for spdi in spdi_inputs
+    ]
+
+    fetched = []
+    get_sequence = variation_translator.dp.get_sequence
+
+    def _get_sequence(identifier, start, end):
+        fetched.append((start, end))
+        return get_sequence(identifier, start, end)
+
+    monkeypatch.setattr(variation_translator.dp, "get_sequence", _get_sequence)
+    results = variation_translator.translate_many(spdi_inputs, fmt="spdi")
+
+    assert [result.model_dump() for result in results] == expected
+    assert fetched == [(44908820, 44908823)]
+
+
+def test_translate_many_spdi_missing_sequence(variation_translator, monkeypatch):
+    monkeypatch.setattr(
+        variation_translator.dp, "get_sequence", lambda *args, **kwargs: None
+    )
+    with pytest.raises(ValueError, match="Failed to retrieve sequence"):
+        variation_translator.translate_many([sub_input["spdi"]], fmt="spdi")
@@ -144,3 +144,23 @@ def test_translate_vrs_to_alleleprofile(
 ):
     output_dict = allele_translator.translate(vrs_allele).model_dump()
     assert output_dict == alleleprofile_expected_outputs
+
+
+def test_translate_fast_vrs_to_alleleprofile(
+    allele_translator, vrs_allele, alleleprofile_expected_outputs, monkeypatch
+):
+    def _fail(*args, **kwargs):
+        raise AssertionError("translate_fast must not call translate")
+
+    monkeypatch.setattr(allele_translator, "translate", _fail)
+    output_dict = allele_translator.translate_fast(vrs_allele).model_dump()
+    assert output_dict == alleleprofile_expected_outputs
+
+
+def test_translate_fast_does_not_share_contained_sequence(
+    allele_translator, vrs_allele
+):
+    first = allele_translator.translate_fast(vrs_allele)
+    second = allele_translator.translate_fast(vrs_allele)
+    assert first.contained[0] is not second.contained[0]
+    assert first.contained[0].representation is not second.contained[0].representation